@@ -10,7 +10,8 @@ CREATE TABLE event (
     event_id   INT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
     name       VARCHAR(100) NOT NULL,
     date       DATE         NOT NULL,
-    location   VARCHAR(100) NOT NULL
+    location   VARCHAR(100) NOT NULL,
+    INDEX idx_event_date (date)
 ) ENGINE=InnoDB;
 
 CREATE TABLE fighter (
@@ -18,12 +19,14 @@ CREATE TABLE fighter (
     name       VARCHAR(100) NOT NULL,
     height_in  SMALLINT,
     reach_in   SMALLINT,
-    dob        DATE
+    dob        DATE,
+    INDEX idx_fighter_name (name)
 ) ENGINE=InnoDB;
 
 CREATE TABLE referee (
     referee_id INT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
-    name       VARCHAR(50)  NOT NULL
+    name       VARCHAR(50)  NOT NULL,
+    INDEX idx_referee_name (name)
 ) ENGINE=InnoDB;
 
 -- 3)  Fight table with ENUMs and FKs
@@ -1,19 +1,35 @@
+import argparse
+import codecs
 import concurrent.futures
 import csv
+import gzip
+import logging
 import mysql.connector
-from mysql.connector import Error
-import random
+import mysql.connector.pooling
+from mysql.connector import Error, errorcode
 import re
 import requests
+import socket
+import sqlite3
+import sys
 import time
-from bs4 import BeautifulSoup
+from lxml import etree
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from threading import Lock
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter, itemgetter
+from threading import BoundedSemaphore, Lock
 from typing import Dict, List, Optional, Tuple
-from urllib3.exceptions import NameResolutionError
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 import os
 
+# Module-wide logger; worker threads log fetch failures and parse fallbacks here instead of
+# contending on stdout, with %-style args so nothing is formatted below the active level
+logger = logging.getLogger(__name__)
+
 # -----------------------------------------------------------------------
 #  WEB FETCHING UTILITIES
 # -----------------------------------------------------------------------
@@ -23,25 +39,67 @@ Provides functions to retrieve and parse HTML content from web pages, specifical
 It includes thread-safe caching for Fighter objects, a global HTTP session for connection reuse, and parallel fetching capabilities using a thread pool.
 
 Key components:
-- FIGHTER_CACHE: A thread-safe dictionary for caching Fighter objects by URL.
-- CACHE_LOCK: A Lock object to synchronize access to FIGHTER_CACHE.
-- SESSION: A global requests.Session for reusing HTTP connections.
+- FIGHTER_CACHE: A lock-free dictionary for caching Fighter objects by URL.
+- `get_cached_fighter()`: Looks up a previously scraped Fighter by URL without locking.
+- DNS_CACHED_HOSTS, DNS_CACHE_TTL: Hosts whose address lookups are served from memory, and for how long before they are resolved again.
+- `getaddrinfo_with_cache()`: socket.getaddrinfo replacement that caches lookups for DNS_CACHED_HOSTS.
 - HEADERS: HTTP headers with a user-agent to mimic a browser.
-- `get_page_content()`: Fetches and parses a single URL with retry logic and exponential backoff.
-- `fetch_parallel()`: Fetches multiple URLs concurrently using ThreadPoolExecutor.
+- SESSION: A global requests.Session for reusing HTTP connections, carrying HEADERS and a pool of HTTP_POOL_SIZE connections per host.
+- HTTP_SOCKET_OPTIONS, `KeepAliveHTTPAdapter`: TCP_NODELAY and keepalive probes for the pooled connections.
+- HTTP_CACHE_PATH: SQLite file persisting fetched pages between runs (set UFCSTATS_HTTP_CACHE to '' to disable).
+- `http_cache_max_age()`: Per-URL freshness (HTTP_CACHE_MAX_AGE_RULES): details pages are kept for months, the events index is always revalidated.
+- `http_cache_get()`, `http_cache_put()`, `http_cache_touch()`, `http_cache_evict()`: Read, write (gzip-compressed), revalidate and drop cached pages with their ETag/Last-Modified validators.
+- `response_charset()`: Reads the declared charset of a response so parsing can skip encoding detection.
+- `html_parser()`: Builds an lxml HTMLParser for a declared charset, falling back to detection for names libxml2 does not know.
+- `TokenBucket`, HTTP_RATE_LIMIT: Global requests-per-second cap (UFC_MAX_RPS) shared by all fetch threads.
+- HTTP_RETRY, HTTP_TIMEOUT: Retry policy (exponential backoff, Retry-After aware) and timeouts for every request.
+- `get_page_bytes()`: Fetches a single URL's raw HTML, serving fresh cached copies and revalidating stale ones.
+- `get_page_tree()`: Fetches a single URL with get_page_bytes() and parses it into an lxml tree, read with precompiled XPath.
+- FETCH_WORKERS, FETCH_EXECUTOR: Size (UFC_MAX_WORKERS) and instance of the ThreadPoolExecutor shared by all parallel fetches.
+- `fetch_parallel()`: Fetches multiple URLs concurrently on FETCH_EXECUTOR.
 
 All functions are designed to handle errors gracefully and log issues for debugging.
 """
 
-# Cache for storing Fighter objects to avoid redundant HTTP requests
-# Key: Fighter URL, Value: Fighter object
+# Cache for storing Fighter objects to avoid redundant HTTP requests (Key: Fighter URL -> Value: Fighter object).
+# No lock: dict.get and dict.setdefault on str keys are atomic, so reads never block and the first
+# setdefault for a URL decides its canonical Fighter. Two threads missing on the same URL at once may
+# both parse the page; the loser's work is discarded, which is cheaper than locking every access.
 FIGHTER_CACHE: Dict[str, "Fighter"] = {}
 
-# Thread-safe lock to synchronize access to FIGHTER_CACHE
-CACHE_LOCK = Lock()
+def get_cached_fighter(link: str) -> Optional["Fighter"]:
+    """
+    Returns the cached Fighter for the given URL, or None if it has not been scraped yet.
+    """
+    return FIGHTER_CACHE.get(link)
+
+# Every page comes from ufcstats.com, so its address is looked up once and reused for each new
+# connection (and retry) instead of going back to the resolver. Entries expire after DNS_CACHE_TTL
+# seconds, so a full-archive run of several hours follows the site if its address changes; failed
+# lookups are not cached.
+DNS_CACHED_HOSTS = frozenset({'ufcstats.com', 'www.ufcstats.com'})
+DNS_CACHE_TTL = 300
+_system_getaddrinfo = socket.getaddrinfo
 
-# Global session for reusing connections
-SESSION = requests.Session()
+# (host, port, family, type, proto, flags) -> (monotonic expiry time, getaddrinfo result). No lock: a
+# lookup racing a refresh at worst resolves the host once more
+_DNS_CACHE: Dict[tuple, Tuple[float, list]] = {}
+
+def getaddrinfo_with_cache(host, port, family=0, type=0, proto=0, flags=0):
+    """
+    Resolves an address like socket.getaddrinfo, serving repeat lookups for DNS_CACHED_HOSTS from memory
+    for up to DNS_CACHE_TTL seconds.
+    """
+    if host not in DNS_CACHED_HOSTS:
+        return _system_getaddrinfo(host, port, family, type, proto, flags)
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    entry = _DNS_CACHE.get(key)
+    if entry is None or entry[0] <= now:
+        entry = _DNS_CACHE[key] = (now + DNS_CACHE_TTL, _system_getaddrinfo(host, port, family, type, proto, flags))
+    return list(entry[1])
+
+socket.getaddrinfo = getaddrinfo_with_cache
 
 # Define headers for the HTTP request
 HEADERS = {
@@ -49,98 +107,381 @@ HEADERS = {
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
         'AppleWebKit/537.36 (KHTML, like Gecko) '
         'Chrome/85.0.4183.121 Safari/537.36'
-    )
+    ),
+    'Accept': 'text/html,application/xhtml+xml',
+    # Compressed transfer: gzip/deflate, plus br when the optional brotli package is installed.
+    # Only encodings urllib3 can actually decode are advertised, and bodies arrive decompressed.
+    'Accept-Encoding': requests.utils.DEFAULT_ACCEPT_ENCODING,
 }
 
-def get_page_content(url: str) -> Optional[BeautifulSoup]:
+# Keep-alive connections kept per host. Sized for the peak concurrency of the scraper (one request per
+# FETCH_EXECUTOR thread, by default one thread per connection); requests' default of 10 would discard
+# and reopen connections whenever more requests than that are in flight. With pool_block, a burst
+# beyond the pool waits for a free connection instead of opening a throwaway one.
+HTTP_POOL_SIZE = 32
+
+# Retries for connection errors and transient statuses, with exponential backoff (1, 2, 4, 8 s ...).
+# A 429/503 carrying Retry-After waits exactly as long as the server asks. After the last attempt the
+# final response is returned rather than raised, so get_page_bytes can log its status.
+HTTP_RETRY = Retry(
+    total=5,
+    backoff_factor=1,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({'GET'}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Timeouts in seconds: (connect, read). The connect timeout is short so a dead or black-holed peer fails
+# (and is retried) within seconds instead of holding a fetch thread; 3.05 sits just above a multiple of
+# the 3 s TCP retransmission window, as the requests docs suggest. The read timeout bounds the gap
+# between bytes, not the whole download, so 15 s still leaves room for the large events index.
+HTTP_TIMEOUT = (3.05, 15)
+
+# Socket options for every pooled connection: urllib3's default (TCP_NODELAY, so small requests are not
+# held back by Nagle's algorithm) plus TCP keepalive probes, so connections left idle between event
+# batches are kept alive through NATs and firewalls instead of being dropped silently and having to be
+# re-established on the next request. The probe timings are set where the platform exposes them (Linux).
+HTTP_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, 'TCP_KEEPIDLE') and hasattr(socket, 'TCP_KEEPINTVL'):
+    HTTP_SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 30),
+    ]
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connection pools open their sockets with HTTP_SOCKET_OPTIONS.
+    """
+    def init_poolmanager(self, *args, **pool_kwargs) -> None:
+        pool_kwargs.setdefault('socket_options', HTTP_SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **pool_kwargs)
+
+# Global session for reusing connections, with the default headers attached once. Both schemes share
+# one adapter (and so one set of pools and one retry policy).
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_HTTP_ADAPTER = KeepAliveHTTPAdapter(
+    pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, pool_block=True, max_retries=HTTP_RETRY
+)
+SESSION.mount('http://', _HTTP_ADAPTER)
+SESSION.mount('https://', _HTTP_ADAPTER)
+
+# On-disk page cache so re-runs skip pages that were already downloaded. Entries younger than
+# HTTP_CACHE_MAX_AGE_SECONDS are served without touching the network; older ones are revalidated
+# with If-None-Match / If-Modified-Since, and a 304 reuses the stored body. Bodies are stored
+# gzip-compressed (HTML shrinks several-fold); rows written uncompressed are still read as-is.
+HTTP_CACHE_PATH = os.environ.get('UFCSTATS_HTTP_CACHE', 'ufc_http_cache.sqlite')
+HTTP_CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+# Per-URL exceptions to HTTP_CACHE_MAX_AGE_SECONDS, first match wins. Event and fight details pages
+# describe completed, historical bouts and rarely change, so a stored copy is served for half a year;
+# it still expires, so a page fetched before ufcstats finished its statistics is eventually revalidated.
+# The completed events index gains entries between runs, so it is revalidated on every request (a 304
+# still skips the download).
+HTTP_CACHE_DETAILS_MAX_AGE_SECONDS = 180 * 24 * 60 * 60
+HTTP_CACHE_MAX_AGE_RULES: Tuple[Tuple[re.Pattern, float], ...] = (
+    (re.compile(r"^https?://(?:www\.)?ufcstats\.com/(?:event|fight)-details/"), HTTP_CACHE_DETAILS_MAX_AGE_SECONDS),
+    (re.compile(r"^https?://(?:www\.)?ufcstats\.com/statistics/events/"), 0),
+)
+
+# One connection shared by all fetch threads, opened on first use and serialized by a lock
+_HTTP_CACHE_CONN: Optional[sqlite3.Connection] = None
+_HTTP_CACHE_LOCK = Lock()
+
+def _http_cache_conn() -> Optional[sqlite3.Connection]:
+    """
+    Returns the shared cache connection, creating the database on first use, or None if caching is disabled.
+    """
+    global _HTTP_CACHE_CONN
+    if not HTTP_CACHE_PATH:
+        return None
+    if _HTTP_CACHE_CONN is None:
+        conn = sqlite3.connect(HTTP_CACHE_PATH, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS page ("
+            "url TEXT PRIMARY KEY, body BLOB NOT NULL, encoding TEXT NOT NULL, "
+            "etag TEXT, last_modified TEXT, fetched_at REAL NOT NULL)"
+        )
+        _HTTP_CACHE_CONN = conn
+    return _HTTP_CACHE_CONN
+
+# Leading bytes of every gzip stream; an HTML page never starts with them
+_GZIP_MAGIC = b'\x1f\x8b'
+
+def http_cache_get(url: str) -> Optional[Tuple[bytes, str, Optional[str], Optional[str], float]]:
+    """
+    Returns the cached (body, encoding, etag, last_modified, fetched_at) for a URL, or None on a miss.
+    """
+    with _HTTP_CACHE_LOCK:
+        conn = _http_cache_conn()
+        if conn is None:
+            return None
+        row = conn.execute(
+            "SELECT body, encoding, etag, last_modified, fetched_at FROM page WHERE url = ?", (url,)
+        ).fetchone()
+    if row is None:
+        return None
+    body, encoding, etag, last_modified, fetched_at = row
+    if body[:2] == _GZIP_MAGIC:
+        body = gzip.decompress(body)
+    return body, encoding, etag, last_modified, fetched_at
+
+def http_cache_put(url: str, body: bytes, encoding: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+    """
+    Stores (or refreshes) a fetched page, gzip-compressed, and its validators in the on-disk cache.
+    """
+    if not HTTP_CACHE_PATH:
+        return
+    # Compress outside the lock so other threads' cache reads are not held up
+    compressed = gzip.compress(body, compresslevel=6)
+    with _HTTP_CACHE_LOCK:
+        conn = _http_cache_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO page (url, body, encoding, etag, last_modified, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (url, compressed, encoding, etag, last_modified, time.time())
+        )
+        conn.commit()
+
+def http_cache_touch(url: str) -> None:
+    """
+    Marks a cached page as freshly validated (after a 304) without rewriting its body.
+    """
+    with _HTTP_CACHE_LOCK:
+        conn = _http_cache_conn()
+        if conn is None:
+            return
+        conn.execute("UPDATE page SET fetched_at = ? WHERE url = ?", (time.time(), url))
+        conn.commit()
+
+def http_cache_evict(url: str) -> None:
+    """
+    Drops a cached page, e.g. one whose body turned out to be unusable, so the next request downloads it again.
+    """
+    with _HTTP_CACHE_LOCK:
+        conn = _http_cache_conn()
+        if conn is None:
+            return
+        conn.execute("DELETE FROM page WHERE url = ?", (url,))
+        conn.commit()
+
+def http_cache_max_age(url: str) -> float:
+    """
+    Returns how long, in seconds, a cached copy of `url` is served without revalidation.
+    """
+    for pattern, max_age in HTTP_CACHE_MAX_AGE_RULES:
+        if pattern.match(url):
+            return max_age
+    return HTTP_CACHE_MAX_AGE_SECONDS
+
+def response_charset(response: requests.Response) -> str:
+    """
+    Returns the charset declared in the response's Content-Type header, defaulting to UTF-8.
+    """
+    if 'charset=' in response.headers.get('Content-Type', '').lower():
+        return response.encoding
+    return 'utf-8'
+
+def html_parser(encoding: str, **kwargs) -> etree.HTMLParser:
+    """
+    Returns an lxml HTMLParser for a page declared in `encoding` (extra keyword arguments are passed on).
+
+    libxml2 knows fewer charset spellings than Python ('latin-1', 'utf_8' and 'koi8_r' raise LookupError),
+    so the name is first mapped to Python's canonical one ('iso8859-1', 'utf-8', 'koi8-r'). If neither
+    Python nor libxml2 knows it, the parser is built without one and detects the encoding from the page.
+    """
+    try:
+        return etree.HTMLParser(encoding=codecs.lookup(encoding).name, **kwargs)
+    except LookupError:
+        logger.debug("[Fetch] Unsupported charset %r, detecting the encoding instead", encoding)
+        return etree.HTMLParser(**kwargs)
+
+class TokenBucket:
+    """
+    Thread-safe token bucket capping the rate of an operation across all threads.
+
+    Tokens accrue at `rate` per second up to `burst`. acquire() takes one token, and only sleeps when
+    the bucket is empty, for exactly as long as it takes the token to accrue; the sleep happens
+    outside the lock, so other threads keep reserving their own slots meanwhile. A `rate` of zero or
+    less means no limit: acquire() returns at once.
     """
-    Retrieves and parses HTML content from a specified URL with (exp. backoff) retry logic.
+    def __init__(self, rate: float, burst: float = 1.0) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+# Politeness limit for ufcstats.com: network requests per second across all fetch threads (UFC_MAX_RPS),
+# with a small burst allowance. Cache hits do not count against it. UFC_MAX_RPS=0 disables the limit.
+HTTP_RATE_LIMIT = float(os.environ.get('UFC_MAX_RPS', 20))
+HTTP_RATE_BURST = 5
+HTTP_RATE_BUCKET = TokenBucket(HTTP_RATE_LIMIT, HTTP_RATE_BURST)
+
+def get_page_bytes(url: str, use_cache: bool = True) -> Optional[Tuple[bytes, str]]:
+    """
+    Retrieves the raw HTML of a specified URL, without parsing it.
 
     Parameters:
-        url (str): The URL to fetch and parse.
+        url (str): The URL to fetch.
+        use_cache (bool): Whether the on-disk page cache may serve or revalidate this URL; how long a
+            copy stays fresh is set per URL by http_cache_max_age(). Defaults to True.
 
     Returns:
-        Optional[BeautifulSoup]: A BeautifulSoup object containing the parsed HTML
-        if the request is successful, otherwise None.
+        Optional[Tuple[bytes, str]]: The response body and its charset if the request is successful, otherwise None.
 
     Functionality:
-        - Sends an HTTP GET request to the provided URL using a global session.
-        - Implements exponential backoff with up to 5 retries on failure.
-        - Introduces a random delay (0.1-0.5 seconds) on success to avoid overwhelming the server.
-        - Uses the 'lxml' parser for faster HTML parsing.
+        - Returns a cached copy without any request if it is younger than http_cache_max_age(url).
+        - Otherwise sends an HTTP GET request to the provided URL using a global session, conditional on
+          the cached ETag/Last-Modified when a stale copy exists; a 304 response reuses the cached body.
+        - Retries connection errors and 429/5xx responses inside the session's adapter (HTTP_RETRY),
+          with exponential backoff that honors Retry-After.
+        - Takes a token from HTTP_RATE_BUCKET before each network request, so the whole scraper stays under
+          HTTP_RATE_LIMIT requests per second without idling threads while it is below the cap.
     """
-    max_retries = 5
-    base_delay = 1
+    cached = http_cache_get(url) if use_cache else None
+    request_headers = None
+    if cached:
+        body, encoding, etag, last_modified, fetched_at = cached
+        max_age = http_cache_max_age(url)
+        if time.time() - fetched_at < max_age:
+            return body, encoding
+        # Stale: ask the server whether our copy is still current
+        request_headers = {}
+        if etag:
+            request_headers['If-None-Match'] = etag
+        if last_modified:
+            request_headers['If-Modified-Since'] = last_modified
     
-    for attempt in range(1, max_retries + 1):
-        # Log retry attempts after the first
-        if attempt > 1:
-            print(f"[DEBUG] Attempt {attempt}/{max_retries} for URL: {url}")
-        try:
-            response = SESSION.get(url, headers=HEADERS, timeout=30)
-            if attempt > 1:
-                print(f"[DEBUG] Status code: {response.status_code} for {url}")
-            if response.status_code == 200:
-                if attempt > 1:
-                    print(f"[DEBUG] Successfully fetched {url}")
-                # Random delay to prevent server overload
-                time.sleep(random.uniform(0.1, 0.5))  # Reduced delay for speed
-                # Parse HTML content with lxml parser
-                return BeautifulSoup(response.content, 'lxml')
-            else:
-                print(f"[ERROR] Failed to retrieve page: status {response.status_code} for {url}")
-        except requests.RequestException as e:
-            print(f"[ERROR] Request failed on attempt {attempt}: {type(e).__name__} - {e} for {url}")
-        except NameResolutionError as dns_e:
-            # Handle DNS resolution failures with a longer delay
-            print(f"[ERROR] DNS resolution failed on attempt {attempt}: {dns_e} for {url}")
-            time.sleep(10)
-        except Exception as e:
-            print(f"[ERROR] Unexpected error on attempt {attempt}: {type(e).__name__} - {e} for {url}")
-        
-        # Calculate exponential backoff delay
-        delay = base_delay * (2 ** (attempt - 1))
-        if attempt < max_retries:
-            print(f"[DEBUG] Retrying after {delay} seconds...")
-        time.sleep(delay)
-        
-    # Log failure after max retries
-    print(f"[ERROR] Max retries exceeded for {url}")
-    return None
+    HTTP_RATE_BUCKET.acquire()
+    try:
+        response = SESSION.get(url, headers=request_headers, timeout=HTTP_TIMEOUT)
+    except requests.RequestException as e:
+        logger.warning("[Fetch] Request failed after retries: %s - %s for %s", type(e).__name__, e, url)
+        return None
+
+    if response.status_code == 304 and cached:
+        # Cached copy is still current: refresh its timestamp and skip the body transfer
+        http_cache_touch(url)
+        return body, encoding
+    if response.status_code != 200:
+        logger.warning("[Fetch] Failed to retrieve page: status %d for %s", response.status_code, url)
+        return None
 
-def fetch_parallel(urls: List[str], max_workers: int = 10) -> Dict[str, Optional[BeautifulSoup]]:
+    if not response.content.strip():
+        # An empty 200 is never stored, or it would be served in place of the page on every later run
+        logger.warning("[Fetch] Empty response body for %s", url)
+        return None
+
+    charset = response_charset(response)
+    if use_cache:
+        http_cache_put(
+            url, response.content, charset,
+            response.headers.get('ETag'), response.headers.get('Last-Modified')
+        )
+    return response.content, charset
+
+def get_page_tree(url: str, use_cache: bool = True) -> Optional[etree._Element]:
     """
-    Fetches multiple URLs in parallel using a thread pool.
+    Retrieves and parses HTML content from a specified URL.
+
+    Parameters:
+        url (str): The URL to fetch and parse.
+        use_cache (bool): Whether the on-disk page cache may be used for this URL. Defaults to True.
+
+    Returns:
+        Optional[etree._Element]: The document's root element, or None if the request failed or the body could not be parsed.
+
+    Functionality:
+        - Fetches the page (or its cached copy) with get_page_bytes().
+        - Parses it with lxml's C HTML parser, passing the declared charset (via html_parser()) so no encoding detection pass is made.
+        - Drops the page from the on-disk cache if it does not parse, so a broken copy is not served again.
+        - Every page is read through precompiled XPath on this tree; no Python object is built per tag or string.
+    """
+    page = get_page_bytes(url, use_cache)
+    if page is None:
+        return None
+    body, encoding = page
+    try:
+        tree = etree.fromstring(body, html_parser(encoding))
+    except etree.LxmlError:
+        tree = None
+    if tree is None:
+        logger.warning("[Fetch] Could not parse page: %s", url)
+        if use_cache:
+            http_cache_evict(url)
+    return tree
+
+# Fetch threads shared by every fetch_parallel call. They are started on demand and reused for the
+# whole run, instead of spawning and joining a fresh pool for each event and each fight.
+# UFC_MAX_WORKERS overrides the default of one thread per pooled HTTP connection.
+FETCH_WORKERS = int(os.environ.get('UFC_MAX_WORKERS', HTTP_POOL_SIZE))
+FETCH_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="fetch")
+
+def fetch_parallel(urls: List[str], max_workers: Optional[int] = None) -> Dict[str, Optional[etree._Element]]:
+    """
+    Fetches multiple URLs in parallel on the shared fetch thread pool.
 
     Parameters:
         urls (List[str]): A list of URLs to fetch.
-        max_workers (int): Maximum number of threads to use. Defaults to 10.
+        max_workers (Optional[int]): Maximum number of this call's requests in flight at once.
+                                     Defaults to FETCH_WORKERS; never more than the number of URLs.
 
     Returns:
-        Dict[str, Optional[BeautifulSoup]]: A dictionary mapping each URL to its
-        parsed BeautifulSoup object, or None if the fetch failed.
+        Dict[str, Optional[etree._Element]]: A dictionary mapping each URL to its
+        parsed lxml tree, or None if the fetch failed.
 
     Functionality:
-        - Utilizes ThreadPoolExecutor to fetch multiple URLs concurrently.
-        - Calls get_page_content() for each URL to retrieve and parse HTML.
-        - Limits the number of concurrent threads to prevent overwhelming the server.
+        - Submits get_page_tree() once for each distinct URL to FETCH_EXECUTOR; a single URL is
+          fetched directly on the calling thread.
+        - Limits this call's concurrent requests to min(max_workers, number of URLs) with a semaphore,
+          to prevent overwhelming the server.
         - Returns a dictionary with results for all URLs, even if some fail.
     """
-    # Initialize result dictionary to store URL to BeautifulSoup mappings
+    # Initialize result dictionary to store URL to page tree mappings
     results = {}
-    # Create thread pool with specified max workers  
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Map futures to URLs for tracking
-        future_to_url = {executor.submit(get_page_content, url): url for url in urls}
-        # Process completed futures as they finish
-        for future in concurrent.futures.as_completed(future_to_url):
-            url = future_to_url[future]
+    # Each distinct URL is requested once, however often it appears in the input
+    unique_urls = list(dict.fromkeys(urls))
+    if len(unique_urls) <= 1:
+        # Nothing to overlap: skip the thread hand-off
+        for url in unique_urls:
             try:
-                results[url] = future.result()
+                results[url] = get_page_tree(url)
             except Exception as e:
-                # Log failure but continue processing other URLs
-                print(f"[ERROR] Parallel fetch failed for {url}: {e}")
+                logger.error("[Fetch] Parallel fetch failed for %s: %s", url, e)
                 results[url] = None
+        return results
+
+    # Each submission takes a slot that is handed back when its fetch finishes
+    slots = BoundedSemaphore(min(len(unique_urls), max_workers or FETCH_WORKERS))
+    future_to_url = {}
+    for url in unique_urls:
+        slots.acquire()
+        future = FETCH_EXECUTOR.submit(get_page_tree, url)
+        future.add_done_callback(lambda _: slots.release())
+        future_to_url[future] = url
+    # Process completed futures as they finish
+    for future in concurrent.futures.as_completed(future_to_url):
+        url = future_to_url[future]
+        try:
+            results[url] = future.result()
+        except Exception as e:
+            # Log failure but continue processing other URLs
+            logger.error("[Fetch] Parallel fetch failed for %s: %s", url, e)
+            results[url] = None
     return results
 
 
@@ -156,9 +497,35 @@ Key components:
 - `Event`: A dataclass representing a UFC event with attributes for link, name, date, location, and a list of fights.
 - `parse_fight_links()`: Extracts fight detail URLs from the event page HTML.
 - `create_fights()`: Populates the fights list by fetching and parsing fight pages.
+- `fetch_fight_pages()`, `build_fights()`: The pipelined fight/fighter page fetch and Fight construction steps, shared with `Events.create_fights_bulk()`.
 - `to_string()`: Formats event details into a string for display.
 """
 
+# URL inside a fight row's onclick="doNav('...')", restricted to fight details pages
+_DONAV_FIGHT_LINK_RE = re.compile(r"doNav\('(http://ufcstats\.com/fight-details/[^']+)'\)")
+# The same pattern for the raw page bytes, letting parse_fight_links skip HTML parsing entirely
+_DONAV_FIGHT_LINK_BYTES_RE = re.compile(rb"doNav\('(http://ufcstats\.com/fight-details/[^']+)'\)")
+
+class _FightRowOnclickTarget:
+    """
+    lxml parser target that records the onclick attribute of each <tr> calling doNav().
+
+    lxml calls these methods while parsing instead of building a tree; close() becomes the parse result.
+    There are deliberately no end() or data() methods: lxml only calls the callbacks a target defines,
+    so end tags and text nodes are consumed in C without a Python call each.
+    """
+    def __init__(self) -> None:
+        self.onclicks: List[str] = []
+
+    def start(self, tag, attrib) -> None:
+        if tag == 'tr':
+            onclick = attrib.get('onclick')
+            if onclick and 'doNav(' in onclick:
+                self.onclicks.append(onclick)
+
+    def close(self) -> List[str]:
+        return self.onclicks
+
 @dataclass
 class Event:
     """
@@ -184,35 +551,39 @@ class Event:
             List[str]: A list of URLs pointing to fight pages.
 
         Functionality:
-            - Fetches the event page HTML using get_page_content().
-            - Identifies table rows (<tr>) with an onclick attribute containing 'doNav()'.
-            - Extracts fight links from the doNav() function calls.
+            - Fetches the event page's raw HTML using get_page_bytes().
+            - Scans the raw bytes for doNav('<fight details URL>') calls with one regex, without parsing the HTML.
+            - Only if that finds nothing (e.g. the quotes are written as entities), streams the page through lxml
+              with a parser target that keeps only the onclick attributes of table rows (<tr>) containing 'doNav()',
+              and extracts the fight links from those.
             - Returns an empty list if the page fetch fails or no valid fight links are found.
         """
         # Fetch event page HTML
-        event_page_soup = get_page_content(self.link)
-        if not event_page_soup:
-            print(f"[Event] Could not fetch event page: {self.link}")
+        event_page = get_page_bytes(self.link)
+        if not event_page:
+            logger.warning("[Event] Could not fetch event page: %s", self.link)
             return []
     
-        # Find all <tr> elements with onclick containing doNav()
-        fight_rows = event_page_soup.find_all('tr', onclick=lambda value: value and 'doNav(' in value)
-        if not fight_rows:
-            print(f"[Event] No fight rows with onclick='doNav()' found: {self.link}")
+        # Fast path: the fight rows' doNav() calls, straight from the bytes (order kept, repeats dropped)
+        body, encoding = event_page
+        fight_links = list(dict.fromkeys(match.decode('ascii') for match in _DONAV_FIGHT_LINK_BYTES_RE.findall(body)))
+        if fight_links:
+            return fight_links
+
+        # Fallback: collect the onclick of every <tr> containing doNav(), with attribute values decoded by lxml
+        try:
+            fight_row_onclicks = etree.fromstring(body, html_parser(encoding, target=_FightRowOnclickTarget()))
+        except etree.LxmlError:
+            fight_row_onclicks = None
+        if not fight_row_onclicks:
+            logger.warning("[Event] No fight rows with onclick='doNav()' found: %s", self.link)
+            # Most likely a truncated, unfinished or unparseable page; fetch it afresh next time rather than reuse it
+            http_cache_evict(self.link)
             return []
     
-        # Extract URLs from the doNav() call
-        fight_links = []
-        for row in fight_rows:
-            onclick = row.get('onclick', '')
-            match = re.search(r"doNav\('([^']+)'\)", onclick)
-            if match:
-                link = match.group(1)
-                # Ensure the link is a valid fight details URL
-                if link.startswith('http://ufcstats.com/fight-details/'):
-                    fight_links.append(link.strip())
-    
-        return fight_links
+        # Extract URLs from the doNav() calls in one regex pass over all rows (joined by a separator that
+        # cannot occur in a URL); the pattern only accepts fight details URLs
+        return _DONAV_FIGHT_LINK_RE.findall('\x1f'.join(fight_row_onclicks))
     
     def create_fights(self) -> None:
         """
@@ -223,28 +594,85 @@ class Event:
 
         Functionality:
             - Calls parse_fight_links() to retrieve fight links.
-            - Fetches fight pages in parallel using fetch_parallel() for efficiency.
-            - Creates a Fight object for each valid fight page and appends it to self.fights.
+            - Fetches the fight pages, and every uncached fighter page on the card, in parallel via fetch_fight_pages().
+            - Creates a Fight object for each valid fight page via build_fights().
+
+        To scrape several events, `Events.create_fights_bulk()` does the same for all their pages at once.
         """
         # Retrieve fight links for the event
         fight_links = self.parse_fight_links()
         if not fight_links:
-            print(f"[Event] No fight links found for event: {self.link}")
+            logger.warning("[Event] No fight links found for event: %s", self.link)
             return
         
-        # Parallel fetch all fight pages
-        fight_soups = fetch_parallel(fight_links)
-        
+        # Parallel fetch all fight pages and every fighter on the card not already cached
+        fight_trees, fighter_trees = Event.fetch_fight_pages(fight_links)
+        self.build_fights(fight_links, fight_trees, fighter_trees)
+
+    @staticmethod
+    def fetch_fight_pages(
+        fight_links: List[str],
+    ) -> Tuple[Dict[str, Optional[etree._Element]], Dict[str, Optional[etree._Element]]]:
+        """
+        Fetches the given fight pages and the pages of every fighter in them not already cached, on FETCH_EXECUTOR.
+
+        The two stages are pipelined: as soon as a fight page arrives, its fighter links are parsed and their
+        fetches queued, so fighter pages download while the remaining fight pages are still in flight
+        instead of after the slowest of them. Each fighter page is requested once, however many fights share it.
+
+        Returns:
+            Tuple[Dict, Dict]: Fight link to page tree, and fighter link to page tree (None for failed fetches).
+        """
+        fight_trees: Dict[str, Optional[etree._Element]] = {}
+        fighter_trees: Dict[str, Optional[etree._Element]] = {}
+        pending = {
+            FETCH_EXECUTOR.submit(get_page_tree, link): (fight_trees, link)
+            for link in dict.fromkeys(fight_links)
+        }
+        requested_fighters = set()
+        while pending:
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                results, link = pending.pop(future)
+                try:
+                    page = future.result()
+                except Exception as e:
+                    logger.error("[Fetch] Parallel fetch failed for %s: %s", link, e)
+                    page = None
+                results[link] = page
+                if results is not fight_trees or page is None:
+                    continue
+                try:
+                    fighter_links = Fight.parse_fighter_links(page)
+                except ValueError:
+                    continue  # Reported when the Fight itself is created
+                for fighter_link in fighter_links:
+                    if fighter_link not in requested_fighters and get_cached_fighter(fighter_link) is None:
+                        requested_fighters.add(fighter_link)
+                        pending[FETCH_EXECUTOR.submit(get_page_tree, fighter_link)] = (fighter_trees, fighter_link)
+        return fight_trees, fighter_trees
+
+    def build_fights(
+        self,
+        fight_links: List[str],
+        fight_trees: Dict[str, Optional[etree._Element]],
+        fighter_trees: Dict[str, Optional[etree._Element]],
+    ) -> None:
+        """
+        Creates a Fight for each of the event's fight links from already fetched pages and appends it to self.fights.
+
+        `fight_trees` and `fighter_trees` may hold pages of other events as well; only this event's links are used.
+        """
         for link in fight_links:
             try:
-                if fight_soups.get(link) is None:
-                    print(f"[Event] Skipping fight due to failed fetch: {link}")
+                if fight_trees.get(link) is None:
+                    logger.warning("[Event] Skipping fight due to failed fetch: %s", link)
                     continue
-                # Create Fight object with pre-fetched soup
-                fight = Fight(link, fight_soups.get(link))
+                # Create Fight object with the pre-fetched fight and fighter page trees
+                fight = Fight(link, fight_trees.get(link), fighter_trees)
                 self.fights.append(fight)
             except Exception as e:
-                print(f"[Event] Failed to create Fight from link {link}: {e}")
+                logger.error("[Event] Failed to create Fight from link %s: %s", link, e)
                 
     def to_string(self, scrape_time: Optional[float] = None) -> str:
         output = (
@@ -269,12 +697,105 @@ It provides functionality to parse event data, create `Event` objects, and store
 Key components:
 - `Events`: A class to manage the collection and storage of UFC event data.
 - `create_event()`: Creates an Event object from a table row of event data.
-- `create_events()`: Populates the events list with Event objects for events after a specified date.
+- `create_events()`: Populates the events list with Event objects for events after a specified date or not yet stored.
+- `create_fights_bulk()`: Populates the fights of many events with one batch of fight page fetches and one of fighter page fetches.
 - `parse_event_link()`, `parse_event_name()`, `parse_event_date()`, `parse_event_location()`: Helper methods for parsing event attributes.
 - `to_csv()`: Writes event, fight, fighter, and round statistics to a CSV file.
+- `iter_csv_rows()`, `flatten_fight()`: Build the CSV rows for `to_csv()`, one fight at a time.
 - `to_sql()`: Inserts scraped data into a MySQL database.
+- `write_event_shard()`, `insert_events()`: Write one shard of the events, in `to_sql()`'s concurrent writers.
 """
 
+# Parameterized insert for one fighter's statistics in one round; rows are sent in batches via executemany
+_ROUNDSTATS_INSERT_SQL = (
+    "INSERT INTO roundstats (round_id, fighter_id, "
+    "knockdowns, non_sig_strikes_landed, non_sig_strikes_attempted, "
+    "takedowns_landed, takedowns_attempted, submission_attempts, "
+    "reversals, control_time_seconds, head_strikes_landed, "
+    "head_strikes_attempted, body_strikes_landed, body_strikes_attempted, "
+    "leg_strikes_landed, leg_strikes_attempted, distance_strikes_landed, "
+    "distance_strikes_attempted, clinch_strikes_landed, clinch_strikes_attempted, "
+    "ground_strikes_landed, ground_strikes_attempted) "
+    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+)
+
+# Round statistics exported per fighter and round by to_csv, in column order
+ROUND_STAT_FIELDS = (
+    "knockdowns", "non_sig_strikes_landed", "non_sig_strikes_attempted",
+    "takedowns_landed", "takedowns_attempted", "submission_attempts", "reversals",
+    "control_time_seconds", "head_strikes_landed", "head_strikes_attempted",
+    "body_strikes_landed", "body_strikes_attempted", "leg_strikes_landed",
+    "leg_strikes_attempted", "distance_strikes_landed", "distance_strikes_attempted",
+    "clinch_strikes_landed", "clinch_strikes_attempted", "ground_strikes_landed",
+    "ground_strikes_attempted",
+)
+
+# Rounds per fight with CSV columns; missing rounds are written as empty values
+CSV_MAX_ROUNDS = 5
+
+# Write buffer for the CSV export. Rows are ~250 columns wide, so the default 8 KiB buffer would be
+# flushed with a write() system call every few rows; 1 MiB batches them into far fewer, larger writes.
+CSV_WRITE_BUFFER_BYTES = 1 << 20
+
+# Full CSV header, built once: event, fighter and fight columns, then the round statistics of
+# fighters A and B for each round (e.g. 'round_1_fighter_a_knockdowns')
+_CSV_HEADER = (
+    "event_name", "event_date", "event_location", "event_link",
+    "fighter_a_name", "fighter_a_link", "fighter_a_height_in", "fighter_a_reach_in", "fighter_a_dob",
+    "fighter_b_name", "fighter_b_link", "fighter_b_height_in", "fighter_b_reach_in", "fighter_b_dob",
+    "fight_link", "winner", "weight_class", "gender", "title_fight", "method_of_victory",
+    "round_of_victory", "time_of_victory_sec", "time_format", "referee",
+) + tuple(
+    f"round_{rnd}_fighter_{side}_{field}"
+    for rnd in range(1, CSV_MAX_ROUNDS + 1) for side in ("a", "b") for field in ROUND_STAT_FIELDS
+)
+
+# Reads all ROUND_STAT_FIELDS of a RoundStats in one C-level call, as a tuple in column order
+_ROUND_STATS_GETTER = attrgetter(*ROUND_STAT_FIELDS)
+_NO_ROUND_STATS = (None,) * len(ROUND_STAT_FIELDS)
+_NO_FIGHTER = (None,) * 5
+
+def _csv_fighter_columns(fighter: Optional["Fighter"]) -> tuple:
+    """
+    The five CSV columns of a fighter (name, link, height, reach, DOB), empty if there is no fighter.
+    """
+    if fighter is None:
+        return _NO_FIGHTER
+    return (fighter.name, fighter.link, fighter.height_in, fighter.reach_in, fighter.dob)
+
+# Precompiled XPath over the events index page (an lxml tree from get_page_tree()). Class tests match
+# one token of the class attribute, as a CSS class selector does.
+def _xpath_has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# The completed event rows in one expression: the rows after the 'first' marker row (the upcoming event)
+# in the body of the events table
+_EVENT_ROWS_XPATH = etree.XPath(
+    f"(//table[{_xpath_has_class('b-statistics__table-events')}])[1]/descendant::tbody[1]"
+    f"/descendant::tr[{_xpath_has_class('b-statistics__table-row_type_first')}][1]"
+    f"/following-sibling::tr[{_xpath_has_class('b-statistics__table-row')}]"
+)
+_EVENT_ROW_LINK_XPATH = etree.XPath("(.//a)[1]")
+_EVENT_ROW_SPAN_XPATH = etree.XPath("(.//span)[1]")
+_EVENT_ROW_CELLS_XPATH = etree.XPath(".//td")
+
+@lru_cache(maxsize=2048)
+def _parse_event_date_string(date_str: str) -> datetime.date:
+    """
+    Parses an events index date ('March 9, 2024'). Memoized, so a date string is only run through
+    strptime once per process.
+
+    Raises:
+        ValueError: If the string is not in that format.
+    """
+    return datetime.strptime(date_str, '%B %d, %Y').date()
+
+def _stripped_text(element) -> str:
+    """
+    Text of an lxml element and its descendants, each piece stripped and concatenated.
+    """
+    return "".join(piece.strip() for piece in element.itertext())
+
 class Events:
     # -----------------------------------------------------------------------
     # constructor
@@ -286,12 +807,13 @@ class Events:
     # -----------------------------------------------------------------------
     # main driver
     # -----------------------------------------------------------------------    
-    def create_event(self, row) -> Event:
+    def create_event(self, row, event_date: Optional[datetime.date] = None) -> Event:
         """
         Creates an Event object from a table row of event data.
 
         Parameters:
-            row: A BeautifulSoup object representing a table row (<tr>) containing event data.
+            row: An lxml element for a table row (<tr>) containing event data.
+            event_date (Optional[date]): The row's date if the caller already parsed it; parsed from the row otherwise.
 
         Returns:
             Event: An Event object with parsed attributes (link, name, date, location).
@@ -303,56 +825,58 @@ class Events:
         # Extract event attributes using helper methods
         link = self.parse_event_link(row)
         name = self.parse_event_name(row)
-        date = self.parse_event_date(row)
+        date = event_date if event_date is not None else self.parse_event_date(row)
         location = self.parse_event_location(row)
         return Event(link=link, name=name, date=date, location=location)
 
-    def create_events(self, start_date: Optional[date] = None) -> None:
+    def create_events(self, start_date: Optional[date] = None, stored_events: Optional[set] = None) -> None:
         """
-        Populates the events list with Event objects for events newer than the specified date.
+        Populates the events list with Event objects for events newer than the specified date that are not yet stored.
 
         Parameters:
             start_date (Optional[date]): Only include events after this date. If None, all events are included.
+            stored_events (Optional[set]): (name, date) of events already in the database, from `get_stored_event_keys()`;
+                                           these are skipped wherever they appear in the index. If None, none are skipped.
 
         Returns:
             None
 
         Functionality:
-            - Fetches the events page HTML using get_page_content().
-            - Locates the events table and processes rows after the 'first' marker row, which represents the upcoming (future) event.
+            - Fetches the events page as an lxml tree using get_page_tree(); this index lists every
+              event, so it is the largest page of the run.
+            - Selects, with a single precompiled XPath, the events table rows after the 'first' marker row, which represents the upcoming (future) event.
             - Stops processing if an event's date is older than or equal to start_date.
+            - Skips events whose (name, date) is in stored_events, but keeps scanning past them, so events missing
+              from an earlier partial write (older than the newest stored one) are picked up again.
             - Creates and appends Event objects to self.events for each valid row.
+
+        Rows are handled in order on the calling thread: create_event() only reads the already parsed
+        row and does no I/O, so a thread pool here would add hand-off cost without overlapping any
+        network waits. The per-event page fetches are fanned out by create_fights_bulk() instead.
         """
         # Fetch events page HTML
-        events_page_soup = get_page_content(self.events_page_url)
-        if not events_page_soup:
-            print("Could not load page content.")
+        # The index gains new events between runs, so its cached copy is always revalidated first
+        events_page_tree = get_page_tree(self.events_page_url)
+        if events_page_tree is None:
+            logger.warning("[Events] Could not load page content: %s", self.events_page_url)
             return
 
-        # Locate the events table
-        events_table = events_page_soup.find('table', class_='b-statistics__table-events')
-        if not events_table:
-            print("Events table not found on page.")
-            return
-        # Find the table body     
-        tbody = events_table.find('tbody')
-        if not tbody:
-            print("Table body is missing.")
-            return
-
-        # Skip the 'first' row, which represents the upcoming (future) event that has not yet occurred
-        future_event = tbody.find('tr', class_='b-statistics__table-row_type_first')
-        if not future_event:
-            print("First marker row not found; no events to parse.")
+        # Completed event rows, skipping the 'first' row, which represents the upcoming (future) event
+        # that has not yet occurred
+        event_rows = _EVENT_ROWS_XPATH(events_page_tree)
+        if not event_rows:
+            logger.warning("[Events] No completed event rows found in the events table: %s", self.events_page_url)
             return
         
-        # Process completed event rows after the future event
-        for event_row in future_event.find_next_siblings('tr', class_='b-statistics__table-row'):
+        for event_row in event_rows:
             event_date = self.parse_event_date(event_row)
             # Stop processing if event is older than or equal to the start_date
             if start_date and event_date and event_date <= start_date:
                 break
-            event = self.create_event(event_row)
+            if stored_events and (self.parse_event_name(event_row), event_date) in stored_events:
+                continue
+            # Reuse the date parsed for the cutoff check rather than running strptime on it again
+            event = self.create_event(event_row, event_date)
             self.events.append(event)
 
     # -----------------------------------------------------------------------
@@ -363,30 +887,29 @@ class Events:
         """
         Extracts the event link from a table row.
         """
-        try:
-            return row.a['href'].strip()
-        except (AttributeError, KeyError, TypeError):
-            return None
+        links = _EVENT_ROW_LINK_XPATH(row)
+        href = links[0].get('href') if links else None
+        return href.strip() if href is not None else None
 
     @staticmethod
     def parse_event_name(row) -> Optional[str]:
         """
         Extracts the event name from a table row.
         """
-        try:
-            return row.a.get_text(strip=True)
-        except AttributeError:
-            return None
+        links = _EVENT_ROW_LINK_XPATH(row)
+        return _stripped_text(links[0]) if links else None
 
     @staticmethod
     def parse_event_date(row) -> Optional[datetime.date]:
         """
         Extracts and parses the event date from a table row.
         """
+        spans = _EVENT_ROW_SPAN_XPATH(row)
+        if not spans:
+            return None
         try:
-            date_str = row.find('span').text.strip()
-            return datetime.strptime(date_str, '%B %d, %Y').date()
-        except (AttributeError, ValueError):
+            return _parse_event_date_string("".join(spans[0].itertext()).strip())
+        except ValueError:
             return None
 
     @staticmethod
@@ -394,10 +917,31 @@ class Events:
         """
         Extracts the event location from a table row.
         """
-        try:
-            return row.find_all('td')[1].get_text(strip=True)
-        except (IndexError, AttributeError):
-            return None
+        cells = _EVENT_ROW_CELLS_XPATH(row)
+        return _stripped_text(cells[1]) if len(cells) > 1 else None
+
+    def create_fights_bulk(self, events: Optional[List[Event]] = None) -> None:
+        """
+        Populates the fights of several events at once (default: all of self.events).
+
+        Functionality:
+            - Fetches the event pages in parallel on FETCH_EXECUTOR and parses their fight links.
+            - Fetches the union of all their fight pages and uncached fighter pages with a single
+              Event.fetch_fight_pages() call, so the connection pool stays busy across event boundaries
+              instead of draining at the end of each card.
+            - Builds each event's Fight objects from the shared results via Event.build_fights().
+        """
+        events = self.events if events is None else events
+        links_per_event = list(FETCH_EXECUTOR.map(Event.parse_fight_links, events))
+        for event, fight_links in zip(events, links_per_event):
+            if not fight_links:
+                logger.warning("[Event] No fight links found for event: %s", event.link)
+
+        fight_trees, fighter_trees = Event.fetch_fight_pages(
+            [link for fight_links in links_per_event for link in fight_links]
+        )
+        for event, fight_links in zip(events, links_per_event):
+            event.build_fights(fight_links, fight_trees, fighter_trees)
   
     def to_csv(self, filename: str) -> None:
         """
@@ -413,83 +957,64 @@ class Events:
             - Creates a CSV file where each row represents a fight, including associated event details,
               fighter information, fight outcomes, and per-round statistics for up to 5 rounds.
             - Missing rounds are filled with None values.
+            - Writes the precomputed header, then streams the rows of `iter_csv_rows()` to the file as they are built.
         """
-        # Define round statistics fields
-        round_stat_fields = [
-        "knockdowns", "non_sig_strikes_landed", "non_sig_strikes_attempted",
-        "takedowns_landed", "takedowns_attempted", "submission_attempts", "reversals",
-        "control_time_seconds", "head_strikes_landed", "head_strikes_attempted",
-        "body_strikes_landed", "body_strikes_attempted", "leg_strikes_landed",
-        "leg_strikes_attempted", "distance_strikes_landed", "distance_strikes_attempted",
-        "clinch_strikes_landed", "clinch_strikes_attempted", "ground_strikes_landed",
-        "ground_strikes_attempted"
-        ]
-
-        # Initialize list to store rows for CSV
-        rows = []
-        
-        # Iterate through each fight within each event
-        for event in self.events:
-            for fight in event.fights:
-                # Create base row with event and fight details
-                base_row = {
-                    "event_name": event.name,
-                    "event_date": event.date,
-                    "event_location": event.location,
-                    "event_link": event.link,
-
-                    "fighter_a_name": fight.fighter_a.name if fight.fighter_a else None,
-                    "fighter_a_link": fight.fighter_a.link if fight.fighter_a else None,
-                    "fighter_a_height_in": fight.fighter_a.height_in if fight.fighter_a else None,
-                    "fighter_a_reach_in": fight.fighter_a.reach_in if fight.fighter_a else None,
-                    "fighter_a_dob": fight.fighter_a.dob if fight.fighter_a else None,
-    
-                    "fighter_b_name": fight.fighter_b.name if fight.fighter_b else None,
-                    "fighter_b_link": fight.fighter_b.link if fight.fighter_b else None,
-                    "fighter_b_height_in": fight.fighter_b.height_in if fight.fighter_b else None,
-                    "fighter_b_reach_in": fight.fighter_b.reach_in if fight.fighter_b else None,
-                    "fighter_b_dob": fight.fighter_b.dob if fight.fighter_b else None,
-                    
-                    "fight_link": fight.link,
-                    "winner": fight.winner,
-                    "weight_class": fight.weight_class,
-                    "gender": fight.gender,
-                    "title_fight": fight.title_fight,
-                    "method_of_victory": fight.method_of_victory,
-                    "round_of_victory": fight.round_of_victory,
-                    "time_of_victory_sec": fight.time_of_victory_sec,
-                    "time_format": fight.time_format,
-                    "referee": fight.referee,
-                }
-    
-                # Add round stats for up to 5 rounds
-                for rnd in range(5):
-                    prefix_a = f"round_{rnd+1}_fighter_a_"
-                    prefix_b = f"round_{rnd+1}_fighter_b_"
-                    stats_a = fight.rounds[rnd].fighter_a_roundstats if rnd < len(fight.rounds) else None
-                    stats_b = fight.rounds[rnd].fighter_b_roundstats if rnd < len(fight.rounds) else None
-    
-                    # Add stats for fighter_a and fighter_b using dictionary comprehension
-                    for prefix, stats in [(prefix_a, stats_a), (prefix_b, stats_b)]:
-                        base_row.update({
-                            f"{prefix}{field}": getattr(stats, field, None) for field in round_stat_fields
-                        })
-    
-                rows.append(base_row)
-
         # Check if there is data to write
-        if not rows:
+        if not any(event.fights for event in self.events):
             print("No data to write.")
             return
 
-        # Write data to CSV file
-        with open(filename, mode='w', newline='', encoding='utf-8', errors='replace') as file:
-            writer = csv.DictWriter(file, fieldnames=rows[0].keys())
-            writer.writeheader()
-            writer.writerows(rows)
+        # Stream rows to the CSV file as they are built, instead of holding them all in memory first;
+        # writerows drains the generator in C, so only the current fight's row is alive at a time
+        with open(filename, mode='w', newline='', encoding='utf-8', errors='replace', buffering=CSV_WRITE_BUFFER_BYTES) as file:
+            writer = csv.writer(file)
+            writer.writerow(_CSV_HEADER)
+            writer.writerows(self.iter_csv_rows())
     
         print(f"CSV written to {filename}")
 
+    def iter_csv_rows(self):
+        """
+        Yields one CSV row per fight of every event, as a flat tuple in _CSV_HEADER order.
+        """
+        for event in self.events:
+            event_columns = (event.name, event.date, event.location, event.link)
+            for fight in event.fights:
+                yield self.flatten_fight(event_columns, fight)
+
+    @staticmethod
+    def flatten_fight(event_columns: tuple, fight: "Fight") -> tuple:
+        """
+        Builds a fight's CSV row: the event columns, both fighters, the fight details, then the round
+        statistics of up to CSV_MAX_ROUNDS rounds (None-filled for rounds not fought).
+        """
+        row = (
+            event_columns
+            + _csv_fighter_columns(fight.fighter_a)
+            + _csv_fighter_columns(fight.fighter_b)
+            + (
+                fight.link,
+                fight.winner,
+                fight.weight_class,
+                fight.gender,
+                fight.title_fight,
+                fight.method_of_victory,
+                fight.round_of_victory,
+                fight.time_of_victory_sec,
+                fight.time_format,
+                fight.referee,
+            )
+        )
+
+        # Add round stats for up to CSV_MAX_ROUNDS rounds, one attrgetter call per fighter and round
+        for rnd in range(CSV_MAX_ROUNDS):
+            if rnd < len(fight.rounds):
+                round_ = fight.rounds[rnd]
+                row += _ROUND_STATS_GETTER(round_.fighter_a_roundstats) + _ROUND_STATS_GETTER(round_.fighter_b_roundstats)
+            else:
+                row += _NO_ROUND_STATS + _NO_ROUND_STATS
+        return row
+
     def to_sql(self, user: str, password: str, host: str = 'localhost', database: str = 'UFCStats', auth_plugin: str = 'mysql_native_password') -> None:
         """
         Inserts scraped UFC event data, including events, fights, fighters, referees, rounds, and round statistics, into a MySQL database.
@@ -506,13 +1031,20 @@ class Events:
 
         Functionality:
             - Establishes a connection to the MySQL database using provided credentials.
-            - Iterates through all events in self.events and inserts:
+            - Skips events whose (name, date) is already stored, found with one lookup via `get_existing_event_keys()`.
+            - Inserts the remaining events:
                 1. Event details (name, date, location) into the 'event' table.
-                2. Fighter details (name, height, reach, DOB) into the 'fighter' table, using upsert to avoid duplicates.
-                3. Referee details (name) into the 'referee' table, using upsert to avoid duplicates.
-                4. Fight details (event ID, fighter IDs, winner, weight class, etc.) into the 'fight' table.
-                5. Round details (fight ID, round number) and per-fighter round statistics (knockdowns, strikes, etc.) into the 'round' and 'roundstats' tables.
-            - Commits all changes to the database and closes the connection.
+                2. Fighter details (name, height, reach, DOB) into the 'fighter' table, resolved for the whole run up front by `insert_fighters_bulk()`.
+                3. Referee details (name) into the 'referee' table, resolved up front by `insert_referees_bulk()`.
+                4. Fight details (event ID, fighter IDs, winner, weight class, etc.) into the 'fight' table, one batch per event via `insert_fights_bulk()`.
+                5. Round details (fight ID, round number) into the 'round' table, one batch per event via `insert_rounds_bulk()`.
+                6. Per-fighter round statistics (knockdowns, strikes, etc.) into the 'roundstats' table, buffered across events
+                   and written DB_INSERT_BATCH_SIZE rows per statement via `insert_roundstats_bulk()`.
+            - Commits the fighters and referees, then writes the events in DB_WRITE_WORKERS shards concurrently via
+              `write_event_shard()`, each shard over its own connection and in its own transaction. Shards that
+              committed before a failure stay stored. Since main() selects the events to scrape by their
+              (name, date) keys rather than by the newest stored date, the next run fetches the failed shards'
+              events again, including ones older than events that were committed.
 
         Raises:
             mysql.connector.Error: If a database operation fails.
@@ -520,123 +1052,167 @@ class Events:
         # Establish database connection
         conn = connect_to_mysql(host=host, user=user, password=password, database=database, auth_plugin=auth_plugin)
         cursor = conn.cursor()
+
+        # Skip events stored by an earlier run (e.g. one re-run after an interruption)
+        existing_events = get_existing_event_keys(cursor, [event.date for event in self.events])
+        events = [event for event in self.events if (event.name, event.date) not in existing_events]
+        if len(events) < len(self.events):
+            print(f"Skipping {len(self.events) - len(events)} events already in the database.")
+
+        # Resolve every fighter and referee of the run up front, in batches rather than per fight
+        all_fights = [fight for event in events for fight in event.fights]
+        fighter_ids_by_name = insert_fighters_bulk(
+            cursor, [f for fight in all_fights for f in (fight.fighter_a, fight.fighter_b)]
+        )
+        referee_ids_by_name = insert_referees_bulk(cursor, [fight.referee for fight in all_fights])
+
+        # The fighter and referee rows must be committed before the writers' own connections can reference them
+        conn.commit()
+        cursor.close()
+        conn.close()
+
+        # Events share nothing below the fighter/referee level, so disjoint shards of them are written
+        # concurrently, each over its own (pooled) connection and in its own transaction
+        db_config = dict(host=host, user=user, password=password, database=database, auth_plugin=auth_plugin)
+        shard_count = min(DB_WRITE_WORKERS, len(events))
+        if shard_count:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=shard_count, thread_name_prefix="db") as executor:
+                futures = [
+                    executor.submit(self.write_event_shard, db_config, events[i::shard_count], fighter_ids_by_name, referee_ids_by_name)
+                    for i in range(shard_count)
+                ]
+                # Surface the first failure; the other shards still finish and commit
+                for future in futures:
+                    future.result()
+        print("Data committed to database successfully.")
+
+    @staticmethod
+    def write_event_shard(
+        db_config: dict,
+        events: List[Event],
+        fighter_ids_by_name: Dict[str, int],
+        referee_ids_by_name: Dict[str, int]
+    ) -> None:
+        """
+        Inserts a group of events with their fights, rounds and round statistics over one connection, in one transaction.
+
+        Parameters:
+            db_config (dict): Keyword arguments for `connect_to_mysql()`.
+            events (List[Event]): The events to insert.
+            fighter_ids_by_name (Dict[str, int]): Fighter name to fighter_id, from `insert_fighters_bulk()`.
+            referee_ids_by_name (Dict[str, int]): Referee name to referee_id, from `insert_referees_bulk()`.
+
+        Returns:
+            None
+
+        Functionality:
+            - For each event, inserts the 'event' row, its fights via `insert_fights_bulk()` and their rounds via `insert_rounds_bulk()`.
+            - Buffers the round statistics across events, writing DB_INSERT_BATCH_SIZE rows per statement via `insert_roundstats_bulk()`.
+            - Commits once at the end. If MySQL picks the transaction as a deadlock victim, it is rolled back
+              and the whole shard retried, up to DB_DEADLOCK_RETRIES times with a short backoff.
+
+        Raises:
+            mysql.connector.Error: If a database operation fails (including a deadlock on the last attempt).
+        """
+        conn = connect_to_mysql(**db_config)
+        cursor = conn.cursor()
+        try:
+            for attempt in range(DB_DEADLOCK_RETRIES + 1):
+                try:
+                    Events.insert_events(cursor, events, fighter_ids_by_name, referee_ids_by_name)
+                    conn.commit()
+                    return
+                except mysql.connector.Error as e:
+                    conn.rollback()
+                    if e.errno != errorcode.ER_LOCK_DEADLOCK or attempt == DB_DEADLOCK_RETRIES:
+                        raise
+                    logger.warning("[DB] Deadlock writing %d events, retrying (attempt %d)", len(events), attempt + 1)
+                    time.sleep(0.1 * 2 ** attempt)
+        finally:
+            cursor.close()
+            conn.close()
+
+    @staticmethod
+    def insert_events(
+        cursor,
+        events: List[Event],
+        fighter_ids_by_name: Dict[str, int],
+        referee_ids_by_name: Dict[str, int]
+    ) -> None:
+        """
+        Executes the inserts for `write_event_shard()`: each event's row, fights, rounds and round statistics.
+        Does not commit.
+        """
+        # Round statistics are buffered across events and written DB_INSERT_BATCH_SIZE rows per statement
+        roundstats_rows = []
     
-        for event in self.events:
+        for event in events:
             # 1) Insert event into the 'event' table
-            print(f"Inserting event: {event.name}")
+            # Runs on the DB writer threads, and again for each deadlock retry of the shard
+            logger.debug("[DB] Inserting event: %s", event.name)
             cursor.execute(
                 "INSERT INTO event (name, date, location) VALUES (%s, %s, %s)",
                 (event.name, event.date, event.location)
             )
             event_id = cursor.lastrowid
+            fight_rows = []
+            fighter_ids_per_fight = []
     
             for fight in event.fights:
-                # 2) Upsert fighters A and B into the 'fighter' table
+                # 2) Look up fighters A and B; a fighter without a name is inserted on its own
                 fighter_ids = {}
                 for side, fighter in (('a', fight.fighter_a), ('b', fight.fighter_b)):
                     if fighter:
-                        # Check if fighter exists
-                        cursor.execute(
-                            "SELECT fighter_id FROM fighter WHERE name = %s",
-                            (fighter.name,)
-                        )
-                        row = cursor.fetchone()
-                        if row:
-                            fighter_ids[side] = row[0]
+                        if fighter.name:
+                            fighter_ids[side] = fighter_ids_by_name[fighter.name]
                         else:
-                            # Insert new fighter
                             cursor.execute(
                                 "INSERT INTO fighter (name, height_in, reach_in, dob) "
                                 "VALUES (%s, %s, %s, %s)",
                                 (fighter.name, fighter.height_in, fighter.reach_in, fighter.dob)
                             )
                             fighter_ids[side] = cursor.lastrowid
+                fighter_ids_per_fight.append(fighter_ids)
     
-                # 3) Upsert referee into the 'referee' table (if present)
-                referee_id = None
-                if fight.referee:
-                    cursor.execute(
-                        "SELECT referee_id FROM referee WHERE name = %s",
-                        (fight.referee,)
-                    )
-                    row = cursor.fetchone()
-                    if row:
-                        referee_id = row[0]
-                    else:
-                        # Insert new referee
-                        cursor.execute(
-                            "INSERT INTO referee (name) VALUES (%s)",
-                            (fight.referee,)
-                        )
-                        referee_id = cursor.lastrowid
-    
-                # 4) Insert fight into the 'fight' table
-                cursor.execute(
-                    "INSERT INTO fight (event_id, fighter_a_id, fighter_b_id, winner, "
-                    "weight_class, gender, title_fight, method_of_victory, "
-                    "round_of_victory, time_of_victory, time_format, referee_id) "
-                    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
-                    (
-                        event_id,
-                        fighter_ids.get('a'),
-                        fighter_ids.get('b'),
-                        fight.winner,
-                        fight.weight_class,
-                        fight.gender,
-                        int(fight.title_fight),
-                        fight.method_of_victory,
-                        fight.round_of_victory,
-                        fight.time_of_victory_sec,
-                        fight.time_format,
-                        referee_id
-                    )
-                )
-                fight_id = cursor.lastrowid
+                # 3) Look up the referee (if present)
+                referee_id = referee_ids_by_name.get(fight.referee) if fight.referee else None
     
-                # 5) Insert rounds and round statistics into 'round' and 'roundstats' tables
+                # 4) Collect the fight's 'fight' row
+                fight_rows.append((
+                    event_id,
+                    fighter_ids.get('a'),
+                    fighter_ids.get('b'),
+                    fight.winner,
+                    fight.weight_class,
+                    fight.gender,
+                    int(fight.title_fight),
+                    fight.method_of_victory,
+                    fight.round_of_victory,
+                    fight.time_of_victory_sec,
+                    fight.time_format,
+                    referee_id
+                ))
+
+            # 5) Insert the event's fights, then all of their rounds, one batch each
+            fight_ids = insert_fights_bulk(cursor, event_id, fight_rows)
+            round_ids = insert_rounds_bulk(
+                cursor, [(fight_id, rnd.round_number) for fight_id, fight in zip(fight_ids, event.fights) for rnd in fight.rounds]
+            )
+
+            # 6) Collect the round statistics of every round; the stat columns follow ROUND_STAT_FIELDS
+            for fight_id, fight, fighter_ids in zip(fight_ids, event.fights, fighter_ids_per_fight):
                 for rnd in fight.rounds:
-                    # Insert round
-                    cursor.execute(
-                        "INSERT INTO round (fight_id, round_number) VALUES (%s, %s)",
-                        (fight_id, rnd.round_number)
-                    )
-                    round_id = cursor.lastrowid
-
-                    # Insert round statistics for each fighter
-                    for rs in (rnd.fighter_a_roundstats, rnd.fighter_b_roundstats):
-                        fid = fighter_ids['a'] if rs is rnd.fighter_a_roundstats else fighter_ids['b']
-                        cursor.execute(
-                            "INSERT INTO roundstats (round_id, fighter_id, "
-                            "knockdowns, non_sig_strikes_landed, non_sig_strikes_attempted, "
-                            "takedowns_landed, takedowns_attempted, submission_attempts, "
-                            "reversals, control_time_seconds, head_strikes_landed, "
-                            "head_strikes_attempted, body_strikes_landed, body_strikes_attempted, "
-                            "leg_strikes_landed, leg_strikes_attempted, distance_strikes_landed, "
-                            "distance_strikes_attempted, clinch_strikes_landed, clinch_strikes_attempted, "
-                            "ground_strikes_landed, ground_strikes_attempted) "
-                            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
-                            (
-                                round_id, fid,
-                                rs.knockdowns,
-                                rs.non_sig_strikes_landed, rs.non_sig_strikes_attempted,
-                                rs.takedowns_landed, rs.takedowns_attempted,
-                                rs.submission_attempts, rs.reversals,
-                                rs.control_time_seconds,
-                                rs.head_strikes_landed, rs.head_strikes_attempted,
-                                rs.body_strikes_landed, rs.body_strikes_attempted,
-                                rs.leg_strikes_landed, rs.leg_strikes_attempted,
-                                rs.distance_strikes_landed, rs.distance_strikes_attempted,
-                                rs.clinch_strikes_landed, rs.clinch_strikes_attempted,
-                                rs.ground_strikes_landed, rs.ground_strikes_attempted
-                            )
-                        )
-    
-        # Commit all changes to the database
-        conn.commit()
-        print("Data committed to database successfully.")
-        # Close cursor and connection
-        cursor.close()
-        conn.close()
+                    round_id = round_ids[(fight_id, rnd.round_number)]
+                    roundstats_rows.append((round_id, fighter_ids['a']) + _ROUND_STATS_GETTER(rnd.fighter_a_roundstats))
+                    roundstats_rows.append((round_id, fighter_ids['b']) + _ROUND_STATS_GETTER(rnd.fighter_b_roundstats))
+
+            # 7) Write the buffered round statistics once a full batch has accumulated
+            if len(roundstats_rows) >= DB_INSERT_BATCH_SIZE:
+                insert_roundstats_bulk(cursor, roundstats_rows)
+                roundstats_rows = []
+
+        # 8) Write the remaining round statistics
+        insert_roundstats_bulk(cursor, roundstats_rows)
 
 
 # -----------------------------------------------------------------------
@@ -649,11 +1225,22 @@ It provides functionality to parse fighter details from a fighter's page and cac
 
 Key components:
 - `Fighter`: A dataclass representing a UFC fighter with attributes for link, name, height, reach, and DOB.
-- `create_fighter()`: Populates the Fighter object by parsing fighter page HTML.
+- `create_fighter()`: Populates the Fighter object from the fighter page's lxml tree, read with precompiled XPath.
 - `parse_fighter_name()`, `parse_height()`, `parse_reach()`, `parse_dob()`: Helper methods for parsing specific attributes.
 - `to_string()`: Formats fighter details into a string for display.
 """
 
+# Month abbreviations used by fighter DOB strings ('Mon DD, YYYY'), mapped to month numbers
+_MONTH_NUMBERS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+# Precompiled XPath over the fighter page tree: the name in the title, and the items of the details
+# lists ('<i>Height:</i> 5' 11"'), whose label is the item's first <i> and whose value is that <i>'s tail
+_FIGHTER_NAME_XPATH = etree.XPath(f"(//span[{_xpath_has_class('b-content__title-highlight')}])[1]")
+_FIGHTER_DETAIL_LABELS_XPATH = etree.XPath(f"//ul[{_xpath_has_class('b-list__box-list')}]//li/descendant::i[1]")
+
 @dataclass(init=False)
 class Fighter:
     """
@@ -665,63 +1252,68 @@ class Fighter:
     reach_in    : Reach in inches               
     dob         : Date of birth as datetime.date
     """
-    link: str
-    name: Optional[str] = field(default=None, init=False)
-    height_in: Optional[int] = field(default=None, init=False)
-    reach_in: Optional[int] = field(default=None, init=False)
-    dob: Optional[date] = field(default=None, init=False)
+    # No per-instance __dict__: every scraped fighter stays resident until export
+    __slots__ = ("link", "name", "height_in", "reach_in", "dob")
 
-    def __init__(self, link: str, soup: Optional[BeautifulSoup] = None) -> None:
+    link: str
+    name: Optional[str]
+    height_in: Optional[int]
+    reach_in: Optional[int]
+    dob: Optional[date]
+
+    def __new__(cls, link: str, page: Optional[etree._Element] = None) -> "Fighter":
+        # A fighter already scraped is returned as is, so every fight of that fighter shares one object
+        cached = FIGHTER_CACHE.get(link)
+        if cached is not None:
+            return cached
+        return super().__new__(cls)
+
+    def __init__(self, link: str, page: Optional[etree._Element] = None) -> None:
+        # Python also calls __init__ on the cached instance __new__ returned; it is already complete
+        if FIGHTER_CACHE.get(link) is self:
+            return
         self.link = link
-        with CACHE_LOCK:
-            if self.link in FIGHTER_CACHE:
-                cached = FIGHTER_CACHE[self.link]
-                self.name = cached.name
-                self.height_in = cached.height_in
-                self.reach_in = cached.reach_in
-                self.dob = cached.dob
-                return
-        self.create_fighter(soup)  # Pass soup to create_fighter
-        with CACHE_LOCK:
-            FIGHTER_CACHE[self.link] = self
-
-    def create_fighter(self, fighter_page_soup: Optional[BeautifulSoup] = None) -> None:
-        """
-        Populates fighter attributes from a pre-fetched BeautifulSoup object or by fetching the fighter's page.
+        # Slots have no class-level defaults, so fields left unparsed must start out as None
+        self.name = self.height_in = self.reach_in = self.dob = None
+        self.create_fighter(page)  # Pass the pre-fetched page tree to create_fighter
+        # Atomic insert-if-absent: the first writer for a link wins. A thread that lost the race keeps
+        # its own, equally complete, instance
+        FIGHTER_CACHE.setdefault(self.link, self)
+
+    def create_fighter(self, fighter_page_tree: Optional[etree._Element] = None) -> None:
+        """
+        Populates fighter attributes from a pre-fetched fighter page tree or by fetching the fighter's page.
     
         Parameters:
-            fighter_page_soup (Optional[BeautifulSoup]): Pre-fetched BeautifulSoup object containing the fighter's page HTML.
-                                                         If None, the method fetches the page using the fighter's link.
+            fighter_page_tree (Optional[etree._Element]): Pre-fetched lxml tree of the fighter's page, as returned by get_page_tree().
+                                                          If None, the method fetches the page using the fighter's link.
     
         Returns:
             None
     
         Functionality:
-            - Fetches the fighter's page HTML using get_page_content() if no fighter_page_soup is provided.
+            - Fetches the fighter's page tree using get_page_tree() if no fighter_page_tree is provided.
             - Parses the fighter's name from the highlighted title section.
             - Extracts fighter details (height, reach, date of birth) from the page's list elements.
             - Populates the Fighter object's attributes: name, height_in, reach_in, and dob.
             - Caches the Fighter object only if the name is successfully parsed to avoid incomplete data.
         """
-        # Fetch fighter page HTML if no soup is provided
-        fighter_page_soup = get_page_content(self.link) if fighter_page_soup is None else fighter_page_soup
-        if fighter_page_soup is None:
-            print(f"[Fighter] Could not fetch page: {self.link}")
+        # Fetch the fighter page if no tree is provided
+        fighter_page_tree = get_page_tree(self.link) if fighter_page_tree is None else fighter_page_tree
+        if fighter_page_tree is None:
+            logger.warning("[Fighter] Could not fetch page: %s", self.link)
             return
 
         # Parse fighter name
-        self.name = self.parse_fighter_name(fighter_page_soup)
+        self.name = self.parse_fighter_name(fighter_page_tree)
 
         # Extract details from list elements
         details = {}
-        for li in fighter_page_soup.select('ul.b-list__box-list li'):
-            try:
-                label = li.i.get_text(strip=True).rstrip(':').upper()
-                value = li.i.next_sibling.strip()
-                details[label] = value
-            except AttributeError:
-                print("[Fighter] Malformed <li> skipped.")
+        for label_tag in _FIGHTER_DETAIL_LABELS_XPATH(fighter_page_tree):
+            if label_tag.tail is None:
+                logger.debug("[Fighter] Malformed <li> skipped.")
                 continue
+            details[_stripped_text(label_tag).rstrip(':').upper()] = label_tag.tail.strip()
 
         # Parse and assign height, reach, and date of birth
         self.height_in = self.parse_height(details.get("HEIGHT"))
@@ -730,21 +1322,21 @@ class Fighter:
     
         # Skip caching if name is missing to avoid incomplete data
         if self.name is None:
-            print(f"[Fighter] Skipping cache due to missing name: {self.link}")
+            logger.debug("[Fighter] Skipping cache due to missing name: %s", self.link)
             return
 
     # -----------------------------------------------------------------------
     # individual helpers
     # -----------------------------------------------------------------------
     @staticmethod
-    def parse_fighter_name(fighter_page_soup: BeautifulSoup) -> Optional[str]:
+    def parse_fighter_name(fighter_page_tree: etree._Element) -> Optional[str]:
         """
         Extracts the fighter's name from the highlighted title section of their page.
         """
-        span = fighter_page_soup.find('span', class_='b-content__title-highlight')
-        if span:
-            return span.get_text(strip=True)
-        print("[Fighter] Name not found.")
+        spans = _FIGHTER_NAME_XPATH(fighter_page_tree)
+        if spans:
+            return _stripped_text(spans[0])
+        logger.debug("[Fighter] Name not found.")
         return None
 
     @staticmethod
@@ -754,11 +1346,12 @@ class Fighter:
         """
         if not height_string:
             return None
-        match = re.match(r"(\d+)'[\s]*(\d+)", height_string)
-        if match:
-            feet, inches = map(int, match.groups())
-            return feet * 12 + inches
-        print(f"[Fighter] Height parse fail: {height_string}")
+        # Split on the feet marker and keep the digits before the inches marker
+        feet, sep, rest = height_string.partition("'")
+        inches = rest.lstrip().partition('"')[0].rstrip()
+        if sep and feet.isdecimal() and inches.isdecimal():
+            return int(feet) * 12 + int(inches)
+        logger.debug("[Fighter] Height parse fail: %s", height_string)
         return None
 
     @staticmethod
@@ -768,10 +1361,11 @@ class Fighter:
         """
         if not reach_string:
             return None
-        match = re.search(r"\d+", reach_string)
-        if match:
-            return int(match.group(0))
-        print(f"[Fighter] Reach parse fail: {reach_string}")
+        # Drop the inches marker and any fractional part (e.g. 76.0")
+        inches = reach_string.strip().partition('"')[0].partition(".")[0]
+        if inches.isdecimal():
+            return int(inches)
+        logger.debug("[Fighter] Reach parse fail: %s", reach_string)
         return None
 
 
@@ -783,20 +1377,22 @@ class Fighter:
         if not dob_string:
             return None
         try:
-            return datetime.strptime(dob_string, '%b %d, %Y').date()
-        except ValueError:
-            print(f"[Fighter] DOB parse fail: {dob_string}")
+            # Avoid datetime.strptime, which re-enters its pure-Python format parser on every call
+            month, day, year = dob_string.replace(",", " ").split()
+            return date(int(year), _MONTH_NUMBERS[month.capitalize()], int(day))
+        except (KeyError, ValueError):
+            logger.debug("[Fighter] DOB parse fail: %s", dob_string)
             return None
     
     def to_string(self) -> str:
-        return (
-            f"Fighter Profile:\n"
-            f"Link: {self.link}\n"
-            f"Name: {self.name}\n"
-            f"Height (in): {self.height_in}\n"
-            f"Reach (in): {self.reach_in}\n"
-            f"DOB: {self.dob}"
-        )
+        return "\n".join((
+            "Fighter Profile:",
+            f"Link: {self.link}",
+            f"Name: {self.name}",
+            f"Height (in): {self.height_in}",
+            f"Reach (in): {self.reach_in}",
+            f"DOB: {self.dob}",
+        ))
 
 
 # -----------------------------------------------------------------------
@@ -810,20 +1406,56 @@ It provides functionality to parse performance metrics from fight page HTML tabl
 Key components:
 - `RoundStats`: A dataclass representing per-fighter round statistics.
 - `create_roundstats()`: Populates the RoundStats object by parsing totals and significant strikes table rows.
-- `parse_total_stats()`, `parse_sig_strikes_stats()`: Extract specific performance metrics from HTML.
-- `split_x_of_y()`, `parse_control_time_to_seconds()`, `to_int()`, `get_text()`: Helper methods for parsing data.
+- `parse_total_stats()`, `parse_sig_strikes_stats()`: Extract specific performance metrics from the rows' lxml elements.
+- `split_x_of_y()`, `parse_control_time_to_seconds()`, `to_int()`, `cell_texts()`: Helper methods for parsing data.
 - `to_string()`: Formats round statistics into a string for display.
 
 The class processes HTML table rows to extract detailed fight statistics for integration with the `Round` class.
 """
 
+# Precompiled XPath over a round's table rows (lxml elements of the fight page tree). Each cell holds one
+# <p> per fighter; the link expressions for table position 0 and 1 pick that fighter's link in the name cell
+_ROW_CELLS_XPATH = etree.XPath(".//td")
+
+_CELL_PARAGRAPH_LINK_XPATHS = (
+    etree.XPath("(((.//p)[1]//a)[1])/@href", smart_strings=False),
+    etree.XPath("(((.//p)[2]//a)[1])/@href", smart_strings=False),
+)
+
+# Cells of each round row that hold statistics, fetched together in one C-level call; cell 0 is the fighter name
+_TOTALS_STAT_CELLS = itemgetter(1, 2, 4, 5, 7, 8, 9)        # KD, Sig. str., Total str., Td, Sub. att, Rev., Ctrl
+_SIG_STRIKES_STAT_CELLS = itemgetter(3, 4, 5, 6, 7, 8)      # Head, Body, Leg, Distance, Clinch, Ground
+
+# Display layout of RoundStats.to_string, parsed once at import rather than built from 21 f-strings per call
+_ROUNDSTATS_SUMMARY_TEMPLATE = "\n".join((
+    "Fighter Link: {stats.fighter_link}",
+    "Knockdowns: {stats.knockdowns}",
+    "Non-Sig Strikes Landed: {stats.non_sig_strikes_landed}",
+    "Non-Sig Strikes Attempted: {stats.non_sig_strikes_attempted}",
+    "Takedowns Landed: {stats.takedowns_landed}",
+    "Takedowns Attempted: {stats.takedowns_attempted}",
+    "Submission Attempts: {stats.submission_attempts}",
+    "Reversals: {stats.reversals}",
+    "Control Time (sec): {stats.control_time_seconds}",
+    "Head Strikes Landed: {stats.head_strikes_landed}",
+    "Head Strikes Attempted: {stats.head_strikes_attempted}",
+    "Body Strikes Landed: {stats.body_strikes_landed}",
+    "Body Strikes Attempted: {stats.body_strikes_attempted}",
+    "Leg Strikes Landed: {stats.leg_strikes_landed}",
+    "Leg Strikes Attempted: {stats.leg_strikes_attempted}",
+    "Distance Strikes Landed: {stats.distance_strikes_landed}",
+    "Distance Strikes Attempted: {stats.distance_strikes_attempted}",
+    "Clinch Strikes Landed: {stats.clinch_strikes_landed}",
+    "Clinch Strikes Attempted: {stats.clinch_strikes_attempted}",
+    "Ground Strikes Landed: {stats.ground_strikes_landed}",
+    "Ground Strikes Attempted: {stats.ground_strikes_attempted}",
+))
+
 @dataclass(init=False)
 class RoundStats:
     """
     Attributes
     ----------
-    totals_tr                   : BeautifulSoup object representing the totals table row
-    sig_strikes_tr              : BeautifulSoup object representing the significant strikes table row
     position                    : Fighter position in the table (0 or 1)
     
     fighter_link                : URL of the fighter's details page
@@ -849,49 +1481,63 @@ class RoundStats:
     ground_strikes_landed       : Number of significant strikes landed on ground
     ground_strikes_attempted    : Number of significant strikes attempted on ground
     """
-    totals_tr: Optional[BeautifulSoup]
-    sig_strikes_tr: Optional[BeautifulSoup]
+    # No per-instance __dict__: two of these exist for every round of every fight scraped
+    __slots__ = ("position", "fighter_link") + ROUND_STAT_FIELDS
+
     position: Optional[int]   # 0 or 1
 
-    fighter_link: Optional[str] = field(default=None)
-    knockdowns: Optional[int] = field(default=None)
-    non_sig_strikes_landed: Optional[int] = field(default=None)
-    non_sig_strikes_attempted: Optional[int] = field(default=None)
-    takedowns_landed: Optional[int] = field(default=None)
-    takedowns_attempted: Optional[int] = field(default=None)
-    submission_attempts: Optional[int] = field(default=None)
-    reversals: Optional[int] = field(default=None)
-    control_time_seconds: Optional[int] = field(default=None)
-
-    head_strikes_landed: Optional[int] = field(default=None)
-    head_strikes_attempted: Optional[int] = field(default=None)
-    body_strikes_landed: Optional[int] = field(default=None)
-    body_strikes_attempted: Optional[int] = field(default=None)
-    leg_strikes_landed: Optional[int] = field(default=None)
-    leg_strikes_attempted: Optional[int] = field(default=None)
-    distance_strikes_landed: Optional[int] = field(default=None)
-    distance_strikes_attempted: Optional[int] = field(default=None)
-    clinch_strikes_landed: Optional[int] = field(default=None)
-    clinch_strikes_attempted: Optional[int] = field(default=None)
-    ground_strikes_landed: Optional[int] = field(default=None)
-    ground_strikes_attempted: Optional[int] = field(default=None)
+    fighter_link: Optional[str]
+    knockdowns: Optional[int]
+    non_sig_strikes_landed: Optional[int]
+    non_sig_strikes_attempted: Optional[int]
+    takedowns_landed: Optional[int]
+    takedowns_attempted: Optional[int]
+    submission_attempts: Optional[int]
+    reversals: Optional[int]
+    control_time_seconds: Optional[int]
+
+    head_strikes_landed: Optional[int]
+    head_strikes_attempted: Optional[int]
+    body_strikes_landed: Optional[int]
+    body_strikes_attempted: Optional[int]
+    leg_strikes_landed: Optional[int]
+    leg_strikes_attempted: Optional[int]
+    distance_strikes_landed: Optional[int]
+    distance_strikes_attempted: Optional[int]
+    clinch_strikes_landed: Optional[int]
+    clinch_strikes_attempted: Optional[int]
+    ground_strikes_landed: Optional[int]
+    ground_strikes_attempted: Optional[int]
 
     # -----------------------------------------------------------------------
     # constructor
     # -----------------------------------------------------------------------
-    def __init__(self, totals_tr: Optional[BeautifulSoup], sig_strikes_tr: Optional[BeautifulSoup], position: Optional[int]) -> None:
-        self.totals_tr = totals_tr
-        self.sig_strikes_tr = sig_strikes_tr
+    def __init__(self, totals_tr: Optional[etree._Element], sig_strikes_tr: Optional[etree._Element], position: Optional[int]) -> None:
         self.position = position
-        self.create_roundstats()
+        # Slots have no class-level defaults; every statistic starts as None and stays so if its row is missing
+        self.fighter_link = self.knockdowns = self.submission_attempts = self.reversals = self.control_time_seconds = None
+        self.non_sig_strikes_landed = self.non_sig_strikes_attempted = None
+        self.takedowns_landed = self.takedowns_attempted = None
+        self.head_strikes_landed = self.head_strikes_attempted = None
+        self.body_strikes_landed = self.body_strikes_attempted = None
+        self.leg_strikes_landed = self.leg_strikes_attempted = None
+        self.distance_strikes_landed = self.distance_strikes_attempted = None
+        self.clinch_strikes_landed = self.clinch_strikes_attempted = None
+        self.ground_strikes_landed = self.ground_strikes_attempted = None
+        # The rows are only needed while parsing; not keeping them lets the fight page's tree be freed
+        self.create_roundstats(totals_tr, sig_strikes_tr)
 
     # -----------------------------------------------------------------------
     # main driver
     # -----------------------------------------------------------------------
-    def create_roundstats(self) -> None:
+    def create_roundstats(self, totals_tr: Optional[etree._Element], sig_strikes_tr: Optional[etree._Element]) -> None:
         """
         Populates the RoundStats object by parsing statistics from the provided totals and significant strikes table rows.
     
+        Parameters:
+            totals_tr (Optional[etree._Element]): The round's row in the totals table.
+            sig_strikes_tr (Optional[etree._Element]): The round's row in the significant strikes table.
+
         Returns:
             None
     
@@ -900,17 +1546,17 @@ class RoundStats:
             - Checks if the significant strikes table row (`sig_strikes_tr`) is provided and calls `parse_sig_strikes_stats()` to extract statistics.
             - Does not modify attributes if the corresponding table row is None, leaving them as their default None values.
         """
-        if self.totals_tr:
-            self.parse_total_stats(self.totals_tr)
-        if self.sig_strikes_tr:
-            self.parse_sig_strikes_stats(self.sig_strikes_tr)
+        if totals_tr is not None:
+            self.parse_total_stats(totals_tr)
+        if sig_strikes_tr is not None:
+            self.parse_sig_strikes_stats(sig_strikes_tr)
 
-    def parse_total_stats(self, totals_tr: BeautifulSoup):
+    def parse_total_stats(self, totals_tr: etree._Element):
         """
         Parses significant strike statistics from a significant strikes table row and updates the RoundStats attributes.
     
         Parameters:
-            sig_strikes_tr (BeautifulSoup): A BeautifulSoup object representing the significant strikes table row (<tr>).
+            sig_strikes_tr (etree._Element): The lxml element of the significant strikes table row (<tr>).
     
         Returns:
             None
@@ -919,43 +1565,45 @@ class RoundStats:
             - Extracts data from the provided table row for fighter performance metrics.
             - Populates attributes for knockdowns, non-significant strikes, takedowns, submission attempts, reversals, and control time.
         """
-        rows = totals_tr.find_all('td')
+        rows = _ROW_CELLS_XPATH(totals_tr)
+        (knockdowns, sig_strikes, total_strikes, takedowns,
+         submission_attempts, reversals, control_time) = self.cell_texts(_TOTALS_STAT_CELLS(rows))
 
         # 1. Fighter link
-        fighter_link = rows[0]
-        p = fighter_link.find_all('p')[self.position]
-        a = p.find('a')
-        self.fighter_link = a['href'].strip() if a and a.has_attr('href') else None
+        href = _CELL_PARAGRAPH_LINK_XPATHS[self.position](rows[0])
+        # Interned like the fight's own fighter links, so each round stores no copy of the URL and
+        # Round.create_round's link comparisons succeed on identity
+        self.fighter_link = sys.intern(href[0].strip()) if href else None
 
         # 2. Knockdowns
-        self.knockdowns = self.to_int(self.get_text(rows[1]))
+        self.knockdowns = self.to_int(knockdowns)
 
         # 2. Non-significant strikes (Derived)
-        sig_landed, sig_attempted = self.split_x_of_y(self.get_text(rows[2]))
-        total_landed, total_attempted = self.split_x_of_y(self.get_text(rows[4]))
+        sig_landed, sig_attempted = self.split_x_of_y(sig_strikes)
+        total_landed, total_attempted = self.split_x_of_y(total_strikes)
 
         if sig_landed >= 0 and total_landed >= 0:
             self.non_sig_strikes_landed = total_landed - sig_landed
             self.non_sig_strikes_attempted = total_attempted - sig_attempted
 
         # 3. Takedowns
-        self.takedowns_landed, self.takedowns_attempted = self.split_x_of_y(self.get_text(rows[5]))
+        self.takedowns_landed, self.takedowns_attempted = self.split_x_of_y(takedowns)
 
         # 4. Submission attempts
-        self.submission_attempts = self.to_int(self.get_text(rows[7]))
+        self.submission_attempts = self.to_int(submission_attempts)
 
         # 5. Reversals
-        self.reversals = self.to_int(self.get_text(rows[8]))
+        self.reversals = self.to_int(reversals)
 
         # 6. Control time
-        self.control_time_seconds = self.parse_control_time_to_seconds(self.get_text(rows[9]))
+        self.control_time_seconds = self.parse_control_time_to_seconds(control_time)
 
-    def parse_sig_strikes_stats(self, sig_strikes_tr: BeautifulSoup):
+    def parse_sig_strikes_stats(self, sig_strikes_tr: etree._Element):
         """
         Parses significant strike statistics from a significant strikes table row and updates the RoundStats attributes.
     
         Parameters:
-            sig_strikes_tr (BeautifulSoup): A BeautifulSoup object representing the significant strikes table row (<tr>).
+            sig_strikes_tr (etree._Element): The lxml element of the significant strikes table row (<tr>).
     
         Returns:
             None
@@ -964,25 +1612,26 @@ class RoundStats:
             - Extracts data from the provided table row for significant strikes by target and position.
             - Populates attributes for head, body, leg, distance, clinch, and ground strikes (landed and attempted).
         """
-        rows = sig_strikes_tr.find_all('td')
+        rows = _ROW_CELLS_XPATH(sig_strikes_tr)
+        head, body, leg, distance, clinch, ground = self.cell_texts(_SIG_STRIKES_STAT_CELLS(rows))
 
         # 1. Head strikes
-        self.head_strikes_landed, self.head_strikes_attempted = self.split_x_of_y(self.get_text(rows[3]))
+        self.head_strikes_landed, self.head_strikes_attempted = self.split_x_of_y(head)
 
         # 2. Body strikes        
-        self.body_strikes_landed, self.body_strikes_attempted = self.split_x_of_y(self.get_text(rows[4]))
+        self.body_strikes_landed, self.body_strikes_attempted = self.split_x_of_y(body)
 
         # 3. Leg strikes
-        self.leg_strikes_landed, self.leg_strikes_attempted = self.split_x_of_y(self.get_text(rows[5]))
+        self.leg_strikes_landed, self.leg_strikes_attempted = self.split_x_of_y(leg)
         
         # 4. Distance strikes
-        self.distance_strikes_landed, self.distance_strikes_attempted = self.split_x_of_y(self.get_text(rows[6]))
+        self.distance_strikes_landed, self.distance_strikes_attempted = self.split_x_of_y(distance)
         
         # 5. Clinch strikes
-        self.clinch_strikes_landed, self.clinch_strikes_attempted = self.split_x_of_y(self.get_text(rows[7]))
+        self.clinch_strikes_landed, self.clinch_strikes_attempted = self.split_x_of_y(clinch)
         
         # 6. Ground strikes
-        self.ground_strikes_landed, self.ground_strikes_attempted = self.split_x_of_y(self.get_text(rows[8]))
+        self.ground_strikes_landed, self.ground_strikes_attempted = self.split_x_of_y(ground)
 
     # -----------------------------------------------------------------------
     # individual helpers
@@ -994,9 +1643,11 @@ class RoundStats:
         
         Returns (-1, -1) if parsing fails.
         """
-        match = re.match(r'(\d+)\s*of\s*(\d+)', stat_string)
-        if match:
-            return int(match.group(1)), int(match.group(2))
+        # Fixed 'X of Y' shape: one partition and two digit checks instead of a regex match
+        landed, sep, attempted = stat_string.partition("of")
+        landed, attempted = landed.strip(), attempted.strip()
+        if sep and landed.isdecimal() and attempted.isdecimal():
+            return int(landed), int(attempted)
         return -1, -1
 
     @staticmethod
@@ -1004,10 +1655,10 @@ class RoundStats:
         """
         Converts a time string in 'MM:SS' format to total seconds.
         """
-        match = re.match(r"(\d+):(\d+)", time_str)
-        if match:
-            minutes, seconds = map(int, match.groups())
-            return minutes * 60 + seconds
+        # Fixed 'M:SS' shape, as Fight.parse_mm_ss
+        minutes, sep, seconds = time_str.partition(":")
+        if sep and minutes.isdecimal() and seconds.isdecimal():
+            return int(minutes) * 60 + int(seconds)
         return None
 
     @staticmethod
@@ -1015,41 +1666,28 @@ class RoundStats:
         """
         Converts a text string to an integer if it represents a valid digit.
         """
-        return int(text) if text.isdigit() else None
+        # Almost every stat cell is a plain count, so try the conversion directly rather than scanning twice
+        try:
+            return int(text)
+        except ValueError:
+            return None
 
-    def get_text(self, td: BeautifulSoup) -> str:
+    def cell_texts(self, cells: Tuple[etree._Element, ...]) -> List[str]:
         """
-        Extracts text from a specific <p> element within a table cell based on the fighter's position.
+        Extracts the text of this fighter's <p> element from each of the given cells of a table row, based on the fighter's position.
+
+        The row is read once up front and the parsers index into the result, instead of searching each cell
+        again per statistic. A cell without a <p> at this position gives an empty string.
         """
-        try:
-            return td.find_all('p')[self.position].get_text(strip=True)
-        except (IndexError, AttributeError):
-            return ""
+        position = self.position
+        texts = []
+        for td in cells:
+            paragraph = next(islice(td.iter("p"), position, None), None)
+            texts.append(_stripped_text(paragraph) if paragraph is not None else "")
+        return texts
 
     def to_string(self) -> str:
-        return (
-            f"Fighter Link: {self.fighter_link}\n"
-            f"Knockdowns: {self.knockdowns}\n"
-            f"Non-Sig Strikes Landed: {self.non_sig_strikes_landed}\n"
-            f"Non-Sig Strikes Attempted: {self.non_sig_strikes_attempted}\n"
-            f"Takedowns Landed: {self.takedowns_landed}\n"
-            f"Takedowns Attempted: {self.takedowns_attempted}\n"
-            f"Submission Attempts: {self.submission_attempts}\n"
-            f"Reversals: {self.reversals}\n"
-            f"Control Time (sec): {self.control_time_seconds}\n"
-            f"Head Strikes Landed: {self.head_strikes_landed}\n"
-            f"Head Strikes Attempted: {self.head_strikes_attempted}\n"
-            f"Body Strikes Landed: {self.body_strikes_landed}\n"
-            f"Body Strikes Attempted: {self.body_strikes_attempted}\n"
-            f"Leg Strikes Landed: {self.leg_strikes_landed}\n"
-            f"Leg Strikes Attempted: {self.leg_strikes_attempted}\n"
-            f"Distance Strikes Landed: {self.distance_strikes_landed}\n"
-            f"Distance Strikes Attempted: {self.distance_strikes_attempted}\n"
-            f"Clinch Strikes Landed: {self.clinch_strikes_landed}\n"
-            f"Clinch Strikes Attempted: {self.clinch_strikes_attempted}\n"
-            f"Ground Strikes Landed: {self.ground_strikes_landed}\n"
-            f"Ground Strikes Attempted: {self.ground_strikes_attempted}"
-        )
+        return _ROUNDSTATS_SUMMARY_TEMPLATE.format(stats=self)
         
 
 # -----------------------------------------------------------------------
@@ -1062,11 +1700,19 @@ It provides functionality to parse round-specific data from fight page HTML and
 
 Key components:
 - `Round`: A dataclass representing a UFC fight round with attributes for round number and fighter statistics.
-- `create_round()`: Populates the Round object by parsing fight page HTML and creating RoundStats objects for both fighters.
+- `index_round_rows()`: Finds the table rows of every round on a fight page in a single pass.
+- `create_round()`: Populates the Round object from its table rows, creating RoundStats objects for both fighters.
 
 The class integrates with the `RoundStats` class for statistics parsing and relies on fighter links to map statistics correctly.
 """
 
+# Text of a per-round table header, e.g. 'Round 3'
+_ROUND_HEADER_RE = re.compile(r"Round (\d+)")
+
+# Candidate round headers, filtered in C before the regex confirms them, and the row that follows a header
+_ROUND_HEADERS_XPATH = etree.XPath("//th[starts-with(normalize-space(.), 'Round ')]")
+_NEXT_ROW_XPATH = etree.XPath("following::tr[1]")
+
 @dataclass
 class Round:
     """
@@ -1076,67 +1722,91 @@ class Round:
     fighter_a_roundstats  : RoundStats object containing statistics for fighter A in this round
     fighter_b_roundstats  : RoundStats object containing statistics for fighter B in this round
     """
+    __slots__ = ("round_number", "fighter_a_roundstats", "fighter_b_roundstats")
+
     round_number: int
-    fighter_a_roundstats: Optional[RoundStats] = field(init=False)
-    fighter_b_roundstats: Optional[RoundStats] = field(init=False)
+    fighter_a_roundstats: Optional[RoundStats]
+    fighter_b_roundstats: Optional[RoundStats]
 
     # -----------------------------------------------------------------------
     # constructor
     # -----------------------------------------------------------------------
-    def __init__(self, round_number: int, fight_page_soup: BeautifulSoup, fighter_links: Tuple[str, str]):
+    def __init__(self, round_number: int, round_rows: Tuple[Optional[etree._Element], Optional[etree._Element]], fighter_a_link: str, fighter_b_link: str):
         self.round_number = round_number
-        self.fight_page_soup = fight_page_soup
-        self.fighter_links = fighter_links
-        self.create_round()
+        self.fighter_a_roundstats = None
+        self.fighter_b_roundstats = None
+        # The rows and links are only needed while parsing; not keeping them lets each
+        # fight page's tree be freed once its rounds are built
+        self.create_round(round_rows, fighter_a_link, fighter_b_link)
 
     # -----------------------------------------------------------------------
     # main driver
     # -----------------------------------------------------------------------
-    def create_round(self) -> None:
+    @staticmethod
+    def index_round_rows(fight_page_tree: etree._Element) -> Dict[int, Tuple[Optional[etree._Element], Optional[etree._Element]]]:
+        """
+        Maps each round number on a fight page to its (totals, significant strikes) table rows.
+
+        Functionality:
+            - Selects the page's <th> elements starting with 'Round ' in one XPath pass, keeping those whose text is 'Round N'.
+            - For each round, takes the first <tr> following its first two headers in document order:
+              the round's row in the totals table and in the significant strikes table.
+            - A round with fewer than two headers gets None for the missing rows.
+
+        Called once per fight page, so a fight's rounds share one pass over the document instead of
+        scanning every <th> again for each round.
+        """
+        headers_by_round: Dict[int, List[etree._Element]] = {}
+        for header in _ROUND_HEADERS_XPATH(fight_page_tree):
+            match = _ROUND_HEADER_RE.fullmatch(_stripped_text(header))
+            if match:
+                headers_by_round.setdefault(int(match.group(1)), []).append(header)
+        round_rows = {}
+        for round_number, headers in headers_by_round.items():
+            # Only the first two headers matter; the following row is looked up for those alone
+            totals_rows = _NEXT_ROW_XPATH(headers[0])
+            sig_strikes_rows = _NEXT_ROW_XPATH(headers[1]) if len(headers) > 1 else ()
+            round_rows[round_number] = (
+                totals_rows[0] if totals_rows else None,
+                sig_strikes_rows[0] if sig_strikes_rows else None,
+            )
+        return round_rows
+
+    def create_round(self, round_rows: Tuple[Optional[etree._Element], Optional[etree._Element]], fighter_a_link: str, fighter_b_link: str) -> None:
         """
-        Populates the Round object by parsing per-round statistics from the fight page HTML and assigning RoundStats objects for both fighters.
+        Populates the Round object from the round's table rows, assigning RoundStats objects for both fighters.
+    
+        Parameters:
+            round_rows (Tuple[Optional[etree._Element], Optional[etree._Element]]): The round's 'totals' and 'significant strikes' rows,
+                as found by index_round_rows().
+            fighter_a_link (str): URL of fighter A's details page.
+            fighter_b_link (str): URL of fighter B's details page.
     
         Returns:
             None
     
         Functionality:
-            - Locates all <th> elements in the fight page HTML (self.fight_page_soup) with text matching 'Round N', where N is self.round_number.
-            - Finds the first two <tr> elements with class 'b-fight-details__table-row' following each matching <th> in document order, representing the 'totals' and 'significant strikes' rows.
             - Creates RoundStats objects for both fighters (positions 0 and 1) using the totals and significant strikes table rows.
-            - Maps each RoundStats object to its corresponding fighter link, retrieved from self.fighter_links.
+            - Maps each RoundStats object to its corresponding fighter link (fighter_a_link, fighter_b_link).
             - Assigns the appropriate RoundStats objects to self.fighter_a_roundstats and self.fighter_b_roundstats based on matching fighter links.
             - Raises a ValueError if the fighter links in the RoundStats objects do not match the expected fighter links, indicating a parsing error.
         """
-        target_text = f"Round {self.round_number}"
-
-        headers = self.fight_page_soup.find_all(
-            "th",
-            string=lambda tag_text: tag_text is not None and tag_text.strip() == target_text
-        )
-
-        rows = [header.find_next(lambda tag: tag.name == "tr") for header in headers] + [None, None]
-        totals_tr, sig_strikes_tr = rows[:2]
+        totals_tr, sig_strikes_tr = round_rows
 
         # Create RoundStats for each table position (0 and 1)
-        round_stats = [RoundStats(totals_tr, sig_strikes_tr, pos) for pos in (0, 1)]
-        
-        # Map from fighter link to corresponding RoundStats
-        stats_by_link = {rs.fighter_link: rs for rs in round_stats}
-        
-        # Unpack fighter links
-        link_a, link_b = self.fighter_links
-        
-        # Ensure both links are present
-        if link_a not in stats_by_link or link_b not in stats_by_link:
+        first, second = RoundStats(totals_tr, sig_strikes_tr, 0), RoundStats(totals_tr, sig_strikes_tr, 1)
+
+        # Assign by fighter link; the table lists the fighters in either order
+        if first.fighter_link == fighter_a_link and second.fighter_link == fighter_b_link:
+            self.fighter_a_roundstats, self.fighter_b_roundstats = first, second
+        elif first.fighter_link == fighter_b_link and second.fighter_link == fighter_a_link:
+            self.fighter_a_roundstats, self.fighter_b_roundstats = second, first
+        else:
             raise ValueError(
                 f"Could not match Round {self.round_number} stats to fighter links.\n"
-                f"Expected: {self.fighter_links}\n"
-                f"Found: {list(stats_by_link.keys())}"
+                f"Expected: {(fighter_a_link, fighter_b_link)}\n"
+                f"Found: {[first.fighter_link, second.fighter_link]}"
             )
-        
-        # Assign correctly
-        self.fighter_a_roundstats = stats_by_link[link_a]
-        self.fighter_b_roundstats = stats_by_link[link_b]
 
 
 # --------------------------------------------------------
@@ -1149,13 +1819,81 @@ It provides functionality to parse fight details, create `Fighter` and `Round` o
 
 Key components:
 - `Fight`: A dataclass representing a UFC fight with attributes for link, gender, title fight status, fighters, winner, weight class, and rounds.
-- `create_fight()`: Populates the Fight object by parsing fight page HTML.
+- `create_fight()`: Populates the Fight object from the fight page's lxml tree, read with precompiled XPath.
 - `parse_fighters()`: Extracts and creates Fighter objects for both fighters.
+- `parse_fighter_links()`: Extracts the two fighter URLs from a fight page.
 - `create_rounds()`: Populates the rounds list with Round objects.
 - `parse_fight_details()`, `parse_winner()`, `parse_weight_class()`, etc.: Helper methods for parsing specific fight attributes.
 - `to_string()`: Formats fight details into a string for display.
 """
 
+# Patterns used by the fight-detail helpers, compiled once at import
+_WS_COLLAPSE_RE = re.compile(r"\s+")
+
+# Weight class keywords mapped to weight limits in pounds (ordered: more specific ones first)
+_WEIGHT_CLASS_MAPPING = (
+    ("catch", 0),
+    ("light heavy", 205),
+    ("straw", 115),
+    ("fly", 125),
+    ("bantam", 135),
+    ("feather", 145),
+    ("light", 155),
+    ("welter", 170),
+    ("middle", 185),
+    ("heavy", 265),
+)
+
+# Layout of Fight.to_string(), parsed once; fields are read from the fight by attribute
+_FIGHT_SUMMARY_TEMPLATE = "\n".join((
+    "Fight Summary:",
+    "Link: {fight.link}",
+    "Fighter A: {fighter_a_name}",
+    "Fighter B: {fighter_b_name}",
+    "Winner: {fight.winner}",
+    "Weight Class: {fight.weight_class}",
+    "Gender: {fight.gender}",
+    "Title Fight: {fight.title_fight}",
+    "Method of Victory: {fight.method_of_victory}",
+    "Round of Victory: {fight.round_of_victory}",
+    "Time of Victory (sec): {fight.time_of_victory_sec}",
+    "Time Format: {fight.time_format}",
+    "Referee: {fight.referee}",
+))
+
+# Result icon of fighter A (W/L/D/NC) mapped to the fight outcome
+_WINNER_MAP = {"W": "A", "L": "B", "D": "Draw", "NC": "NC"}
+
+# Every keyword of interest in a fight title (weight classes, 'women', 'title') as one alternation,
+# so a single regex scan reports all of them; 'light heavy' precedes 'light' and 'heavy'
+_FIGHT_TITLE_KEYWORDS_RE = re.compile(
+    "|".join(re.escape(key) for key in (*(key for key, _ in _WEIGHT_CLASS_MAPPING), "women", "title"))
+)
+
+# Splits the flattened fight details text ("Method: KO/TKO Round: 2 Time: 3:45 Time format: ...") into
+# label/value pairs in one pass; 'Time format' precedes 'Time' so the longer label wins
+_FIGHT_DETAIL_LABELS = "Method|Round|Time format|Time|Referee"
+_FIGHT_LABEL_RE = re.compile(
+    rf"\b(?P<label>{_FIGHT_DETAIL_LABELS})\s*:\s*(?P<val>.*?)\s*(?=\b(?:{_FIGHT_DETAIL_LABELS})\s*:|$)",
+    re.DOTALL,
+)
+
+# Precompiled XPath over the fight page tree (from get_page_tree()), each returning at most the first match.
+# The fighter links sit in the first persons block at the top of the page; attribute values are returned
+# as plain strings, so a stored link does not keep the page tree alive
+_FIGHT_PERSON_LINKS_XPATH = etree.XPath(
+    f"(//div[{_xpath_has_class('b-fight-details__persons')}])[1]"
+    f"//a[{_xpath_has_class('b-fight-details__person-link')}]/@href",
+    smart_strings=False,
+)
+_FIGHT_DETAILS_BLOCK_XPATH = etree.XPath(
+    f"(//p[{_xpath_has_class('b-fight-details__text')}][ancestor::div[{_xpath_has_class('b-fight-details__content')}]])[1]"
+)
+_FIGHT_STATUS_XPATH = etree.XPath(
+    f"(//i[{_xpath_has_class('b-fight-details__person-status')}][ancestor::div[{_xpath_has_class('b-fight-details__person')}]])[1]"
+)
+_FIGHT_TITLE_XPATH = etree.XPath(f"(//i[{_xpath_has_class('b-fight-details__fight-title')}])[1]")
+
 @dataclass(init=False)
 class Fight:
     """
@@ -1175,111 +1913,159 @@ class Fight:
     referee             : Name of the referee
     rounds              : List of Round objects containing per-round statistics
     """
+    __slots__ = (
+        "link", "gender", "title_fight", "fighter_a", "fighter_b", "winner", "weight_class",
+        "method_of_victory", "round_of_victory", "time_of_victory_sec", "time_format", "referee", "rounds",
+    )
+
     link: str
     gender: str  # "M" for men, "F" for women
     title_fight: bool # Defaults to False 
-    fighter_a: Optional[Fighter] = field(init=False)
-    fighter_b: Optional[Fighter] = field(init=False)
-    winner: Optional[str] = field(init=False)   # "A", "B", "Draw", or "NC"
-    weight_class: Optional[int] = field(init=False)
-    method_of_victory: Optional[str] = field(init=False)
-    round_of_victory: Optional[int] = field(init=False)  # takes int value 1-5
-    time_of_victory_sec: Optional[int] = field(init=False) # converted from mm:ss to sec (int)
-    time_format: Optional[int] = field(init=False) # takes int value of either 3 or 5
-    referee: Optional[str] = field(init=False)
-    rounds: List[Round] = field(init=False)     # populated by create_rounds()
+    fighter_a: Optional[Fighter]
+    fighter_b: Optional[Fighter]
+    winner: Optional[str]   # "A", "B", "Draw", or "NC"
+    weight_class: Optional[int]
+    method_of_victory: Optional[str]
+    round_of_victory: Optional[int]  # takes int value 1-5
+    time_of_victory_sec: Optional[int] # converted from mm:ss to sec (int)
+    time_format: Optional[int] # takes int value of either 3 or 5
+    referee: Optional[str]
+    rounds: List[Round]     # populated by create_rounds()
 
     # -----------------------------------------------------------------------
     # constructor
     # -----------------------------------------------------------------------
-    def __init__(self, link: str, fight_page_soup: Optional[BeautifulSoup] = None) -> None:
+    def __init__(
+        self,
+        link: str,
+        fight_page_tree: Optional[etree._Element] = None,
+        fighter_trees: Optional[Dict[str, Optional[etree._Element]]] = None
+    ) -> None:
         self.link = link
         self.gender = "M"
         self.title_fight = False
-        self.create_fight(fight_page_soup)
+        # Slots have no class-level defaults; start every parsed field empty so early returns leave a consistent object
+        self.fighter_a = self.fighter_b = None
+        self.winner = self.weight_class = self.method_of_victory = None
+        self.round_of_victory = self.time_of_victory_sec = self.time_format = self.referee = None
+        self.rounds = []
+        self.create_fight(fight_page_tree, fighter_trees)
 
-    def create_fight(self, pre_fetched_content: Optional[BeautifulSoup] = None) -> None:
+    def create_fight(
+        self,
+        pre_fetched_content: Optional[etree._Element] = None,
+        fighter_trees: Optional[Dict[str, Optional[etree._Element]]] = None
+    ) -> None:
         """
-        Populates the Fight object by parsing fight details from a pre-fetched BeautifulSoup object or by fetching the fight page.
+        Populates the Fight object by parsing fight details from a pre-fetched fight page tree or by fetching the fight page.
     
         Parameters:
-            pre_fetched_content (Optional[BeautifulSoup]): Pre-fetched BeautifulSoup object containing the fight page HTML.
-                                                           If None, the method fetches the page using the fight's link.
+            pre_fetched_content (Optional[etree._Element]): Pre-fetched lxml tree of the fight page, as returned by get_page_tree().
+                                                            If None, the method fetches the page using the fight's link.
+            fighter_trees (Optional[Dict[str, Optional[etree._Element]]]): Fighter pages already fetched by the caller, keyed by URL.
     
         Returns:
             None
     
         Functionality:
-            - Fetches the fight page HTML using `get_page_content` if no pre-fetched content is provided.
+            - Fetches the fight page tree using `get_page_tree` if no pre-fetched content is provided.
+            - Every helper below reads the same parsed tree through precompiled XPath expressions.
             - Calls parse_fighters() to extract and create Fighter objects for both fighters.
             - Calls parse_winner() and parse_weight_class() to populate winner, weight class, gender, and title fight attributes.
             - Parses fight details (method, round, time, time format, referee) using parse_fight_details() and helper methods.
             - Calls create_rounds() to populate the rounds list if both fighters are valid and fighter links are available.
         """
-        fight_page_soup = pre_fetched_content or get_page_content(self.link)
-        if fight_page_soup is None:
-            print(f"[Fight] Could not fetch page: {self.link}")
+        fight_page_tree = pre_fetched_content if pre_fetched_content is not None else get_page_tree(self.link)
+        if fight_page_tree is None:
+            logger.warning("[Fight] Could not fetch page: %s", self.link)
             return
             
-        self.parse_fighters(fight_page_soup)
+        self.parse_fighters(fight_page_tree, fighter_trees)
         if self.fighter_a is None or self.fighter_b is None:
-            print(f"[Fight] Skipping further processing due to missing fighter data: {self.link}")
+            logger.warning("[Fight] Skipping further processing due to missing fighter data: %s", self.link)
             return
 
-        self.parse_winner(fight_page_soup)
-        self.parse_weight_class(fight_page_soup)
+        self.parse_winner(fight_page_tree)
+        self.parse_weight_class(fight_page_tree)
 
-        details = self.parse_fight_details(fight_page_soup)
+        details = self.parse_fight_details(fight_page_tree)
 
-        self.method_of_victory = details.get("METHOD")
+        # Method and referee repeat across thousands of fights; interning keeps one string object per distinct
+        # value, so the fights held in memory and the rows batched for the database share them
+        self.method_of_victory = self.intern_detail(details.get("METHOD"))
         self.round_of_victory = self.parse_round_of_victory(details.get("ROUND"))
         self.time_of_victory_sec = self.parse_mm_ss(details.get("TIME"))
         self.time_format = self.parse_time_format(details.get("TIME FORMAT"))
-        self.referee = details.get("REFEREE")
-
-        fighter_links = (self.fighter_a.link, self.fighter_b.link) if self.fighter_a and self.fighter_b else None
+        self.referee = self.intern_detail(details.get("REFEREE"))
 
-        if fighter_links:
-            self.create_rounds(self.round_of_victory, fight_page_soup, fighter_links)
+        # Both fighters are guaranteed present by the early return above
+        self.create_rounds(self.round_of_victory, fight_page_tree, self.fighter_a.link, self.fighter_b.link)
 
-    def parse_fighters(self, fight_page_soup: BeautifulSoup) -> None:
+    def parse_fighters(
+        self,
+        fight_page_tree: etree._Element,
+        fighter_trees: Optional[Dict[str, Optional[etree._Element]]] = None
+    ) -> None:
         """
         Extracts fighter information from the fight page HTML and populates fighter_a and fighter_b attributes.
     
         Parameters:
-            fight_page_soup (BeautifulSoup): A BeautifulSoup object containing the fight page HTML.
+            fight_page_tree (etree._Element): The lxml tree of the fight page.
+            fighter_trees (Optional[Dict[str, Optional[etree._Element]]]): Fighter pages already fetched by the caller, keyed by URL.
     
         Returns:
             None
     
         Functionality:
-            - Selects anchor tags with class 'b-fight-details__person-link' to extract fighter links.
-            - Raises a ValueError if exactly two fighter links are not found, indicating a malformed fight page.
-            - Fetches fighter pages in parallel using fetch_parallel() with a maximum of two workers for efficiency.
+            - Extracts both fighter links using parse_fighter_links().
+            - Uses pre-fetched fighter pages where available, and fetches the remaining uncached fighter pages
+              in parallel using fetch_parallel() with a maximum of two workers.
             - Creates Fighter objects for both fighters using their respective links and pre-fetched HTML content.
             - Assigns the created Fighter objects to self.fighter_a and self.fighter_b.
         """
-        anchors = fight_page_soup.select("div.b-fight-details__persons a.b-fight-details__person-link")
-        if len(anchors) != 2:
-            raise ValueError("[Fight] Expected two fighter links, found different count.")
-        
-        fighter_links = [anchors[0]["href"].strip(), anchors[1]["href"].strip()]
-        fighter_soups = fetch_parallel(fighter_links, max_workers=2)
-        
-        self.fighter_a = Fighter(fighter_links[0], fighter_soups.get(fighter_links[0]))
-        self.fighter_b = Fighter(fighter_links[1], fighter_soups.get(fighter_links[1]))
+        fighter_links = self.parse_fighter_links(fight_page_tree)
+        # The caller's mapping may hold every fighter page of a whole batch of events, so it is only read,
+        # never copied; pages fetched here go into a small local mapping consulted second
+        fighter_trees = fighter_trees or {}
+        fetched_trees = {}
+
+        missing_links = [
+            link for link in fighter_links
+            if link not in fighter_trees and get_cached_fighter(link) is None
+        ]
+        if missing_links:
+            fetched_trees = fetch_parallel(missing_links, max_workers=2)
+
+        link_a, link_b = fighter_links
+        self.fighter_a = Fighter(link_a, fighter_trees.get(link_a, fetched_trees.get(link_a)))
+        self.fighter_b = Fighter(link_b, fighter_trees.get(link_b, fetched_trees.get(link_b)))
         
         if self.fighter_a is None or self.fighter_b is None:
-            print(f"[Fight] Failed to create one or both fighters for fight: {self.link}")
+            logger.warning("[Fight] Failed to create one or both fighters for fight: %s", self.link)
+
+    @staticmethod
+    def parse_fighter_links(fight_page_tree: etree._Element) -> List[str]:
+        """
+        Extracts the two fighter-details URLs from the fight page tree.
 
-    def create_rounds(self, num_rounds: int, fight_page_soup: BeautifulSoup, fighter_links: Tuple[str, str]) -> None:
+        Raises a ValueError if exactly two fighter links are not found, indicating a malformed fight page.
+        """
+        hrefs = _FIGHT_PERSON_LINKS_XPATH(fight_page_tree)
+        if len(hrefs) != 2:
+            raise ValueError("[Fight] Expected two fighter links, found different count.")
+        # Interned: a fighter's link recurs on every one of their fight pages, and these strings become the
+        # FIGHTER_CACHE keys that the links parsed from each round's table are compared against
+        return [sys.intern(hrefs[0].strip()), sys.intern(hrefs[1].strip())]
+
+    def create_rounds(self, num_rounds: int, fight_page_tree: etree._Element, fighter_a_link: str, fighter_b_link: str) -> None:
         """
         Populates the rounds list with Round objects for the specified number of rounds.
     
         Parameters:
             num_rounds (int): The number of rounds to create (tderived from round_of_victory).
-            fight_page_soup (BeautifulSoup): A BeautifulSoup object containing the fight page HTML.
-            fighter_links (Tuple[str, str]): A tuple containing the links of the two fighters (fighter_a, fighter_b).
+            fight_page_tree (etree._Element): The lxml tree of the fight page.
+            fighter_a_link (str): The link of fighter_a.
+            fighter_b_link (str): The link of fighter_b.
     
         Returns:
             None
@@ -1287,47 +2073,49 @@ class Fight:
         Functionality:
             - Initializes an empty list for self.rounds.
             - Iterates from 1 to num_rounds (inclusive) to create a Round object for each round.
-            - Instantiates each Round object with the round number, fight page HTML, and fighter links.
+            - Indexes the rounds' table rows once with Round.index_round_rows().
+            - Instantiates each Round object with the round number, its table rows, and fighter links.
             - Appends each Round object to self.rounds.
             - Relies on the Round class to handle per-round statistics parsing and assignment.
             - Assumes num_rounds is valid (1-5) and derived from round_of_victory.
         """
         self.rounds = []
 
+        # Locate every round's table rows in one pass over the page
+        round_rows = Round.index_round_rows(fight_page_tree)
         for round_number in range(1, num_rounds + 1):
-            # Round class will later accept (round_number, soup)
-            self.rounds.append(Round(round_number, fight_page_soup, fighter_links))
+            self.rounds.append(
+                Round(round_number, round_rows.get(round_number, (None, None)), fighter_a_link, fighter_b_link)
+            )
             
     # -----------------------------------------------------------------------
     # individual helpers
     # -----------------------------------------------------------------------
-    def parse_fight_details(self, fight_page_soup: BeautifulSoup) -> dict[str, str]:
+    def parse_fight_details(self, fight_page_tree: etree._Element) -> dict[str, str]:
         """
         Parses the fight details section of the fight page HTML into a dictionary keyed by uppercase labels.
     
         Parameters:
-            fight_page_soup (BeautifulSoup): A BeautifulSoup object containing the fight page HTML.
+            fight_page_tree (etree._Element): The lxml tree of the fight page.
     
         Returns:
             dict[str, str]: A dictionary mapping uppercase labels (e.g., 'METHOD', 'ROUND') to their corresponding values.
     
         Functionality:
-            - Selects the fight details block using the CSS selector 'div.b-fight-details__content p.b-fight-details__text'.
+            - Selects the fight details block (the first 'p.b-fight-details__text' inside 'div.b-fight-details__content').
             - Returns an empty dictionary if the details block is not found.
-            - Iterates through all <i> elements with class 'b-fight-details__label' to extract labels and their associated values.
-            - For each label, extracts the text following the colon in the parent element, strips whitespace, and normalizes multiple spaces.
-            - Converts labels to uppercase and stores them with their values in the dictionary.
+            - Flattens the block's text once and splits it into label/value pairs with `_FIGHT_LABEL_RE`.
+            - Normalizes multiple spaces in each value and stores it under its uppercase label.
         """
         details = {}
-        block = fight_page_soup.select_one("div.b-fight-details__content p.b-fight-details__text")
-        if not block:
+        blocks = _FIGHT_DETAILS_BLOCK_XPATH(fight_page_tree)
+        if not blocks:
             return details
     
-        for label_tag in block.select("i.b-fight-details__label"):
-            label = label_tag.get_text(strip=True).rstrip(":").upper()
-            parent = label_tag.parent
-            value = parent.get_text(" ", strip=True).split(":", 1)[-1].strip()
-            details[label] = re.sub(r"\s+", " ", value)
+        # The block's text pieces, each stripped and joined by single spaces
+        block_text = " ".join(filter(None, (piece.strip() for piece in blocks[0].itertext())))
+        for match in _FIGHT_LABEL_RE.finditer(block_text):
+            details[match.group("label").upper()] = _WS_COLLAPSE_RE.sub(" ", match.group("val"))
     
         return details
 
@@ -1344,20 +2132,37 @@ class Fight:
         """
         Converts a time string in 'MM:SS' format to total seconds.
         """
-        if value and (match := re.match(r"(\d+):(\d+)", value)):
-            minutes, seconds = map(int, match.groups())
-            return minutes * 60 + seconds
-        return None
+        if not value:
+            return None
+        # Fixed 'M:SS' shape: a single partition avoids the regex engine entirely
+        minutes, sep, seconds = value.partition(":")
+        if not sep:
+            return None
+        try:
+            return int(minutes) * 60 + int(seconds)
+        except ValueError:
+            return None
     
+    @staticmethod
+    def intern_detail(value: Optional[str]) -> Optional[str]:
+        """
+        Returns the interned copy of a fight detail string, or None if the detail is missing.
+        """
+        return sys.intern(value) if value else value
+
     def parse_time_format(self, value: Optional[str]) -> Optional[int]:
         """
         Extracts the scheduled number of rounds from a time format string.
         """
-        if value and (match := re.match(r"\d+", value)):
-            return int(match.group())
-        return None
+        if not value:
+            return None
+        # Slice off the leading run of digits (e.g. '3 Rnd (5-5-5)' -> '3')
+        end = 0
+        while end < len(value) and value[end].isdecimal():
+            end += 1
+        return int(value[:end]) if end else None
     
-    def parse_winner(self, fight_page_soup: BeautifulSoup) -> None:
+    def parse_winner(self, fight_page_tree: etree._Element) -> None:
         """
         Determines the winner based on result icons in the fight detail section.
     
@@ -1372,76 +2177,42 @@ class Fight:
     
         If no result is found, winner remains None.
         """
-        result_tag = fight_page_soup.select_one("div.b-fight-details__person i.b-fight-details__person-status")
-        result_text = result_tag.get_text(strip=True) if result_tag else None
-        result_mapping = {"W": "A", "L": "B", "D": "Draw", "NC": "NC"}
-        self.winner = result_mapping.get(result_text)
+        result_tags = _FIGHT_STATUS_XPATH(fight_page_tree)
+        result_text = _stripped_text(result_tags[0]) if result_tags else None
+        self.winner = _WINNER_MAP.get(result_text)
         
     @staticmethod
-    def map_weight_class(weight_class_tag: str) -> Optional[int]:
+    @lru_cache(maxsize=64)
+    def classify_weight_class(weight_class_tag: str) -> Tuple[Optional[int], bool, bool]:
         """
-        Maps a weight class string to its weight limit in pounds.
+        Classifies a weight class string in a single keyword scan.
+
+        Returns (weight limit in pounds, is women's fight, is title fight).
+        Memoized: only a handful of distinct weight class strings exist across all fights.
         """
-        weight_class_tag = weight_class_tag.lower()
-        
-        # Ordered patterns: more specific ones first
-        mapping = [
-                ("catch", 0),
-                ("light heavy", 205),
-                ("straw", 115),
-                ("fly", 125),
-                ("bantam", 135),
-                ("feather", 145),
-                ("light", 155),
-                ("welter", 170),
-                ("middle", 185),
-                ("heavy", 265),
-        ]
+        found = set(_FIGHT_TITLE_KEYWORDS_RE.findall(weight_class_tag.lower()))
+        weight_limit = next((limit for key, limit in _WEIGHT_CLASS_MAPPING if key in found), None)
+        return weight_limit, "women" in found, "title" in found
 
-        return next((limit for key, limit in mapping if key in weight_class_tag), None)
-    
-    def parse_weight_class(self, fight_page_soup: BeautifulSoup) -> None:
+    def parse_weight_class(self, fight_page_tree: etree._Element) -> None:
         """
         Extracts the weight class string, infers gender and title fight status, then maps it to a numerical value.
         """
-        weight_class_tag = fight_page_soup.select_one("i.b-fight-details__fight-title")
-        weight_class_str = weight_class_tag.get_text(strip=True) if weight_class_tag else None
-    
-        self.weight_class = self.map_weight_class(weight_class_str) if weight_class_str else None
-    
-        if weight_class_str:
-            if self.is_womens_fight(weight_class_str):
-                self.gender = "F"
-            if self.is_title_fight(weight_class_str):
-                self.title_fight = True          
-    
-    def is_womens_fight(self, weight_class_tag: str) -> bool:
-        """
-        Determines if the fight is a women's fight based on the weight class string.
-        """
-        return 'women' in weight_class_tag.lower()
-    
-    def is_title_fight(self, weight_class_tag: str) -> bool:
-        """
-        Determines if the fight is a title fight based on the weight class string.
-        """
-        return 'title' in weight_class_tag.lower()
+        weight_class_tags = _FIGHT_TITLE_XPATH(fight_page_tree)
+        weight_class_str = _stripped_text(weight_class_tags[0]) if weight_class_tags else None
+        if not weight_class_str:
+            self.weight_class = None
+            return
+
+        self.weight_class, is_womens, is_title = self.classify_weight_class(weight_class_str)
+        if is_womens:
+            self.gender = "F"
+        if is_title:
+            self.title_fight = True
         
     def to_string(self) -> str:
-        return (
-            f"Fight Summary:\n"
-            f"Link: {self.link}\n"
-            f"Fighter A: {self.fighter_a.name}\n"
-            f"Fighter B: {self.fighter_b.name}\n"
-            f"Winner: {self.winner}\n"
-            f"Weight Class: {self.weight_class}\n"
-            f"Gender: {self.gender}\n"
-            f"Title Fight: {self.title_fight}\n"
-            f"Method of Victory: {self.method_of_victory}\n"
-            f"Round of Victory: {self.round_of_victory}\n"
-            f"Time of Victory (sec): {self.time_of_victory_sec}\n"
-            f"Time Format: {self.time_format}\n"
-            f"Referee: {self.referee}"
+        return _FIGHT_SUMMARY_TEMPLATE.format(
+            fight=self, fighter_a_name=self.fighter_a.name, fighter_b_name=self.fighter_b.name
         )
 
 
@@ -1451,15 +2222,72 @@ class Fight:
 
 """
 Functions to interact with the MySQL database used for storing UFC event data. 
-Including utilities for establishing a database connection and retrieving the latest event date.
+Including utilities for establishing a database connection and retrieving the events already stored.
 
 Key components:
-- `connect_to_mysql()`: Establishes a connection to the MySQL database using specified credentials.
-- `get_latest_event_date()`: Retrieves the most recent event date from the database.
+- `load_schema_statements()`: Reads and splits create_database.sql once per process.
+- `connect_to_mysql()`: Establishes a connection to the MySQL database using specified credentials, pooling connections after the first.
+- `get_stored_event_keys()`: Retrieves the (name, date) of every stored event, so a run scrapes only the missing ones.
+- `get_existing_event_keys()`: Looks up which events of a run are already stored, so they are not inserted twice.
+- `insert_fighters_bulk()`, `insert_referees_bulk()`: Resolve names to IDs (under the column collation), inserting any missing rows.
+- `insert_fights_bulk()`, `insert_rounds_bulk()`: Insert an event's fights, or a set of rounds, in one batch and return their IDs.
+- `insert_roundstats_bulk()`: Inserts round statistics as multi-row INSERTs of DB_INSERT_BATCH_SIZE rows.
 
 The module integrates with the MySQL database to support data storage for the scraper.
 """
 
+# Set once connect_to_mysql has confirmed (or created) the database, so later connections in the
+# same process skip the CREATE DATABASE / schema checks
+_DB_VERIFIED = False
+
+# Connections handed out after verification come from this pool (created on first need); closing a
+# pooled connection returns it for reuse instead of tearing down the TCP session and login
+DB_POOL_SIZE = 4
+_DB_POOL: Optional[mysql.connector.pooling.MySQLConnectionPool] = None
+_DB_POOL_LOCK = Lock()
+
+# Concurrent event writers in Events.to_sql, each holding one pooled connection; a shard whose
+# transaction is chosen as a deadlock victim is retried up to DB_DEADLOCK_RETRIES times
+DB_WRITE_WORKERS = DB_POOL_SIZE
+DB_DEADLOCK_RETRIES = 3
+
+# Secondary indexes added to create_database.sql after its first release, as (table, index, column);
+# connect_to_mysql creates any that an existing schema lacks. idx_event_date makes MAX(date) an index
+# lookup; the name indexes turn the bulk fighter/referee lookups in to_sql into index seeks.
+_DB_ADDED_INDEXES = (
+    ('event', 'idx_event_date', 'date'),
+    ('fighter', 'idx_fighter_name', 'name'),
+    ('referee', 'idx_referee_name', 'name'),
+)
+
+# Names per UNION ALL lookup in _select_ids_by_name, keeping each statement well under max_allowed_packet
+DB_LOOKUP_CHUNK_SIZE = 500
+
+# Rows per multi-row INSERT for bulk tables (round statistics: 22 values a row, ~20 KB a statement)
+DB_INSERT_BATCH_SIZE = 500
+
+# Statements in create_database.sql that act on the database itself rather than on its tables
+_DATABASE_LEVEL_STATEMENT_RE = re.compile(r"^(?:\s*--[^\n]*\n)*\s*(?:DROP\s+DATABASE|CREATE\s+DATABASE|USE)\b", re.IGNORECASE)
+
+@lru_cache(maxsize=None)
+def load_schema_statements(path: str = 'create_database.sql') -> Tuple[str, ...]:
+    """
+    Reads the schema script and returns its individual SQL statements.
+
+    The result is cached, so the file is read and split at most once per process, and only
+    when a database actually has to be created.
+
+    Raises:
+        FileNotFoundError: If the script does not exist.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            sql_script = f.read()
+    except FileNotFoundError:
+        print(f"Error: {path} file not found in the current directory.")
+        raise
+    return tuple(statement.strip() for statement in sql_script.split(';') if statement.strip())
+
 def connect_to_mysql(
     host: str = 'localhost',
     user: str = None,
@@ -1470,6 +2298,10 @@ def connect_to_mysql(
     """
     Connect to a MySQL database, creating it and its schema if it does not exist.
 
+    The first call in a process uses a single connection: CREATE DATABASE IF NOT EXISTS, USE, and
+    the schema script only when the 'event' table is missing. Later calls are served from a connection pool
+    (DB_POOL_SIZE connections); closing such a connection returns it to the pool.
+
     Args:
         host (str): The database host. Defaults to 'localhost'.
         user (str): The database user. Must be provided.
@@ -1485,12 +2317,30 @@ def connect_to_mysql(
         FileNotFoundError: If the create_database.sql file is not found.
         ValueError: If required parameters (user, password) are missing.
     """
+    global _DB_VERIFIED, _DB_POOL
+
     # Validate required parameters
     if not user or not password:
         raise ValueError("Database user and password must be provided.")
 
     try:
-        # Connect to MySQL server without specifying a database to check existence
+        # The database was already verified in this process: take a pooled connection to it
+        if _DB_VERIFIED:
+            # Concurrent writers may ask at once; only one of them creates the pool
+            with _DB_POOL_LOCK:
+                if _DB_POOL is None:
+                    _DB_POOL = mysql.connector.pooling.MySQLConnectionPool(
+                        pool_name="ufcstats",
+                        pool_size=DB_POOL_SIZE,
+                        host=host,
+                        user=user,
+                        password=password,
+                        database=database,
+                        auth_plugin=auth_plugin
+                    )
+            return _DB_POOL.get_connection()
+
+        # One connection: create the database if needed, then switch to it
         conn = mysql.connector.connect(
             host=host,
             user=user,
@@ -1498,47 +2348,41 @@ def connect_to_mysql(
             auth_plugin=auth_plugin
         )
         cursor = conn.cursor()
-
-        # Check if the database exists
-        cursor.execute("SHOW DATABASES LIKE %s", (database,))
-        db_exists = cursor.fetchone() is not None
-
-        if not db_exists:
-            print(f"Database {database} does not exist. Creating database and schema...")
-            # Read the SQL script from the external file
-            try:
-                with open('create_database.sql', 'r', encoding='utf-8') as f:
-                    sql_script = f.read()
-            except FileNotFoundError:
-                print("Error: create_database.sql file not found in the current directory.")
-                raise
-            except Exception as e:
-                print(f"Error reading create_database.sql: {e}")
-                raise
-
-            # Execute each statement in the SQL script
-            for statement in sql_script.split(';'):
-                statement = statement.strip()
-                if statement:
-                    try:
-                        cursor.execute(statement)
-                    except mysql.connector.Error as e:
-                        print(f"Error executing SQL statement: {e}")
-                        raise
+        quoted_database = "`" + database.replace("`", "``") + "`"
+        cursor.execute(
+            f"CREATE DATABASE IF NOT EXISTS {quoted_database} "
+            "CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci"
+        )
+        cursor.execute(f"USE {quoted_database}")
+
+        # The event table marks an initialised schema
+        cursor.execute("SHOW TABLES LIKE 'event'")
+        schema_exists = cursor.fetchone() is not None
+
+        if not schema_exists:
+            print(f"Database {database} has no schema. Creating schema...")
+            # Execute the (cached) schema script's table statements; its own DROP/CREATE DATABASE
+            # and USE lines are skipped so the tables land in the database chosen here
+            for statement in load_schema_statements():
+                if _DATABASE_LEVEL_STATEMENT_RE.match(statement):
+                    continue
+                try:
+                    cursor.execute(statement)
+                except mysql.connector.Error as e:
+                    print(f"Error executing SQL statement: {e}")
+                    raise
             conn.commit()
-            print(f"Database {database} and schema created successfully.")
+            print(f"Schema for database {database} created successfully.")
+        else:
+            # Schemas created before these indexes existed get them once
+            for table, index_name, column in _DB_ADDED_INDEXES:
+                cursor.execute(f"SHOW INDEX FROM {table} WHERE Key_name = %s", (index_name,))
+                if not cursor.fetchall():
+                    cursor.execute(f"CREATE INDEX {index_name} ON {table} ({column})")
 
         cursor.close()
-        conn.close()
-
-        # Connect to the specified database
-        return mysql.connector.connect(
-            host=host,
-            user=user,
-            password=password,
-            database=database,
-            auth_plugin=auth_plugin
-        )
+        _DB_VERIFIED = True
+        return conn
 
     except mysql.connector.Error as e:
         print(f"Database connection error: {e}")
@@ -1547,22 +2391,196 @@ def connect_to_mysql(
         print(f"Unexpected error during database setup: {e}")
         raise
 
-def get_latest_event_date(conn) -> Optional[date]:
+def get_stored_event_keys(conn) -> set:
     """
-    Retrieve the date of the most recent event from the event table.
+    Retrieve the (name, date) of every event in the event table.
+
+    Used instead of the latest stored date to decide what to scrape: events written concurrently by
+    `Events.to_sql()` may be stored with gaps when a write fails, and a date cutoff would never revisit
+    events older than the newest one stored. The table holds one small row per UFC event, so reading
+    all of it is a single cheap query.
+
+    Args:
+        conn (mysql.connector.connection.MySQLConnection): An open connection, reused rather than
+            reopened; it is left open for the caller to close.
 
     Returns:
-        Optional[date]: The latest event date, or None if no events exist.
+        set: (name, date) tuples of the stored events; empty if no events exist.
 
     Raises:
         mysql.connector.Error: If the database query fails.
     """
-    cursor = conn.cursor()
-    cursor.execute("SELECT MAX(date) FROM event")
-    row = cursor.fetchone()
-    cursor.close()
-    conn.close()
-    return row[0] if row and row[0] else None
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT name, date FROM event")
+        return set(cursor.fetchall())
+
+def get_existing_event_keys(cursor, dates: List[Optional[date]]) -> set:
+    """
+    Returns the (name, date) of every stored event dated within the range of `dates`.
+
+    One query, bounded below by the earliest date so it is answered from idx_event_date rather than
+    by reading the whole event table. None dates are ignored; with no dates, no query is sent.
+
+    Returns:
+        set: (name, date) tuples of the matching events.
+    """
+    known_dates = [d for d in dates if d is not None]
+    if not known_dates:
+        return set()
+    cursor.execute(
+        "SELECT name, date FROM event WHERE date BETWEEN %s AND %s",
+        (min(known_dates), max(known_dates))
+    )
+    return set(cursor.fetchall())
+
+def _select_ids_by_name(cursor, table: str, id_column: str, names: List[str]) -> Dict[str, int]:
+    """
+    Looks up the IDs of the given names in `table`, DB_LOOKUP_CHUNK_SIZE names per query.
+
+    Each name gets its own `WHERE name = %s` branch of a UNION ALL that returns the name as requested,
+    not as stored. The comparison uses the column's collation (utf8mb4_unicode_ci, which ignores case,
+    accents and trailing spaces), so a scraped "Jose Aldo" resolves to a stored "José Aldo" exactly as a
+    single-name lookup would, instead of being missed by an exact match on the returned name.
+
+    Returns:
+        Dict[str, int]: Name to ID for every name already present (the lowest ID if several rows match);
+                        absent names are omitted.
+    """
+    ids = {}
+    for start in range(0, len(names), DB_LOOKUP_CHUNK_SIZE):
+        chunk = names[start:start + DB_LOOKUP_CHUNK_SIZE]
+        query = " UNION ALL ".join([f"SELECT %s, {id_column} FROM {table} WHERE name = %s"] * len(chunk))
+        cursor.execute(f"{query} ORDER BY 2", tuple(value for name in chunk for value in (name, name)))
+        for name, row_id in cursor.fetchall():
+            ids.setdefault(name, row_id)
+    return ids
+
+def insert_fighters_bulk(cursor, fighters: List["Fighter"]) -> Dict[str, int]:
+    """
+    Resolves fighters to their 'fighter' table IDs, inserting those not yet stored.
+
+    Existing names are found with chunked lookups (see `_select_ids_by_name()`), and one more lookup
+    fetches the IDs of the fighters inserted. This replaces a SELECT, and possibly an INSERT, per
+    fighter per fight. Each missing fighter is inserted only if no row matches its name under the
+    column's collation at that point, so two scraped spellings that the database treats as one name
+    (differing only in case or accents) share a single row. Fighters without a name are skipped, as
+    they cannot be matched by name.
+
+    Args:
+        cursor: An open cursor on the target database.
+        fighters (List[Fighter]): Fighters to resolve; repeats are allowed and the first occurrence is stored.
+
+    Returns:
+        Dict[str, int]: Fighter name to fighter_id.
+    """
+    by_name = {}
+    for fighter in fighters:
+        if fighter and fighter.name:
+            by_name.setdefault(fighter.name, fighter)
+    ids = _select_ids_by_name(cursor, "fighter", "fighter_id", list(by_name))
+    missing = [f for name, f in by_name.items() if name not in ids]
+    if missing:
+        cursor.executemany(
+            "INSERT INTO fighter (name, height_in, reach_in, dob) SELECT %s, %s, %s, %s FROM DUAL "
+            "WHERE NOT EXISTS (SELECT 1 FROM fighter WHERE name = %s)",
+            [(f.name, f.height_in, f.reach_in, f.dob, f.name) for f in missing]
+        )
+        ids.update(_select_ids_by_name(cursor, "fighter", "fighter_id", [f.name for f in missing]))
+    return ids
+
+def insert_referees_bulk(cursor, names: List[str]) -> Dict[str, int]:
+    """
+    Resolves referee names to their 'referee' table IDs, inserting those not yet stored.
+
+    Same approach as `insert_fighters_bulk()`: chunked lookups around one executemany that inserts each
+    missing name unless the database already holds a matching one.
+
+    Args:
+        cursor: An open cursor on the target database.
+        names (List[str]): Referee names; repeats and empty values are ignored.
+
+    Returns:
+        Dict[str, int]: Referee name to referee_id.
+    """
+    unique_names = list(dict.fromkeys(name for name in names if name))
+    ids = _select_ids_by_name(cursor, "referee", "referee_id", unique_names)
+    missing = [name for name in unique_names if name not in ids]
+    if missing:
+        cursor.executemany(
+            "INSERT INTO referee (name) SELECT %s FROM DUAL WHERE NOT EXISTS (SELECT 1 FROM referee WHERE name = %s)",
+            [(name, name) for name in missing]
+        )
+        ids.update(_select_ids_by_name(cursor, "referee", "referee_id", missing))
+    return ids
+
+def insert_fights_bulk(cursor, event_id: int, fight_rows: List[tuple]) -> List[int]:
+    """
+    Inserts an event's fights with one executemany and returns their fight_ids in row order.
+
+    The IDs are read back with one SELECT on event_id ordered by fight_id: auto-increment values increase
+    with row order within a statement under every innodb_autoinc_lock_mode (though they need not be
+    consecutive). The event must be newly inserted in this transaction, so that the only fights
+    referencing it are these.
+
+    Args:
+        cursor: An open cursor on the target database.
+        event_id (int): The event all rows belong to.
+        fight_rows (List[tuple]): (event_id, fighter_a_id, fighter_b_id, winner, weight_class, gender, title_fight,
+            method_of_victory, round_of_victory, time_of_victory, time_format, referee_id) per fight.
+
+    Returns:
+        List[int]: The fight_id of each row, in the order given.
+    """
+    if not fight_rows:
+        return []
+    cursor.executemany(
+        "INSERT INTO fight (event_id, fighter_a_id, fighter_b_id, winner, "
+        "weight_class, gender, title_fight, method_of_victory, "
+        "round_of_victory, time_of_victory, time_format, referee_id) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+        fight_rows
+    )
+    cursor.execute("SELECT fight_id FROM fight WHERE event_id = %s ORDER BY fight_id", (event_id,))
+    return [row[0] for row in cursor.fetchall()]
+
+def insert_rounds_bulk(cursor, round_rows: List[Tuple[int, int]]) -> Dict[Tuple[int, int], int]:
+    """
+    Inserts rounds with one executemany and reads their IDs back, DB_LOOKUP_CHUNK_SIZE fights per SELECT.
+
+    The IDs are re-read by (fight_id, round_number) rather than derived from lastrowid, since
+    InnoDB does not guarantee consecutive auto-increment values for a multi-row INSERT under
+    every innodb_autoinc_lock_mode.
+
+    Args:
+        cursor: An open cursor on the target database.
+        round_rows (List[Tuple[int, int]]): (fight_id, round_number) per round.
+
+    Returns:
+        Dict[Tuple[int, int], int]: (fight_id, round number) to round_id.
+    """
+    if not round_rows:
+        return {}
+    cursor.executemany("INSERT INTO round (fight_id, round_number) VALUES (%s, %s)", round_rows)
+    fight_ids = list(dict.fromkeys(fight_id for fight_id, _ in round_rows))
+    round_ids = {}
+    for start in range(0, len(fight_ids), DB_LOOKUP_CHUNK_SIZE):
+        chunk = fight_ids[start:start + DB_LOOKUP_CHUNK_SIZE]
+        placeholders = ", ".join(["%s"] * len(chunk))
+        cursor.execute(
+            f"SELECT round_id, fight_id, round_number FROM round WHERE fight_id IN ({placeholders})", tuple(chunk)
+        )
+        round_ids.update(((fight_id, number), round_id) for round_id, fight_id, number in cursor.fetchall())
+    return round_ids
+
+def insert_roundstats_bulk(cursor, roundstats_rows: List[tuple]) -> None:
+    """
+    Inserts round statistics rows (_ROUNDSTATS_INSERT_SQL column order), DB_INSERT_BATCH_SIZE rows per statement.
+
+    executemany rewrites each chunk into a single multi-row INSERT ... VALUES (...), (...), so the
+    server parses one statement per chunk instead of one per row.
+    """
+    for start in range(0, len(roundstats_rows), DB_INSERT_BATCH_SIZE):
+        cursor.executemany(_ROUNDSTATS_INSERT_SQL, roundstats_rows[start:start + DB_INSERT_BATCH_SIZE])
 
 
 # -----------------------------------------------------------------------
@@ -1574,6 +2592,7 @@ The `main()` function orchestrates the scraping of UFC event data from ufcstats.
 and stores the results in a MySQL database and CSV file. It integrates with the `Events` class and database utilities to manage the scraping workflow.
 
 Key components:
+- EVENT_BATCH_SIZE: Number of events whose pages are fetched together.
 - `main()`: The primary function that initializes the scraper, fetches new events, processes fight details, and handles data storage.
 - Integrates with `Events` class for event scraping and `database` module for MySQL connectivity.
 - Handles errors gracefully and ensures data is saved to CSV even on failure.
@@ -1581,14 +2600,21 @@ Key components:
 The script is designed to be executed as the entry point for the UFC Stats Scraper application.
 """
 
+# Events scraped per batch. Each batch fetches the fight pages of all its events in one fetch_parallel
+# call (and then their fighter pages in another), so the fetch pool stays saturated across events;
+# data is kept per completed batch if the run is interrupted.
+EVENT_BATCH_SIZE = 8
+
 def main():
     """
     Runs the UFCStats scraper, fetching new events, processing fight details, and storing results in a MySQL database and CSV file.
 
     Functionality:
+        - Parses command-line options; `--verbose` prints a summary of each event after it is scraped.
         - Prompts the user for database credentials (host, user, password, database name, auth plugin).
-        - Initializes an Events manager and retrieves the latest event date from the database.
-        - Scrapes new UFC events after the latest date, including fight and round statistics.
+        - Initializes an Events manager and retrieves the (name, date) of the events already in the database.
+        - Scrapes the UFC events not yet stored, including fight and round statistics,
+          EVENT_BATCH_SIZE events at a time via Events.create_fights_bulk().
         - Stores scraped data in a MySQL database and exports it to a CSV file ('UFCStats.csv').
         - Handles database and general errors gracefully, ensuring data is saved to CSV even on failure.
 
@@ -1600,6 +2626,13 @@ def main():
     Returns:
         None
     """
+    parser = argparse.ArgumentParser(description="Scrape UFC event data from ufcstats.com into MySQL.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print a summary of each scraped event")
+    args = parser.parse_args()
+
+    # Only surface warnings and errors; per-field parse fallbacks are logged at DEBUG
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(message)s")
+
     # Initialize events_manager outside try block to avoid UnboundLocalError
     events_manager = Events()
 
@@ -1620,36 +2653,38 @@ def main():
         if missing_vars:
             raise ValueError(f"Missing required database credentials: {', '.join(missing_vars)}")
 
-        # Connect to MySQL and get latest event date
+        # Connect to MySQL and get the events already stored
         conn = connect_to_mysql(**db_config)
-        latest_date = get_latest_event_date(conn)
+        stored_events = get_stored_event_keys(conn)
         
         # Populate events
-        events_manager.create_events(start_date=latest_date)
+        events_manager.create_events(stored_events=stored_events)
 
         if not events_manager.events:
             print("No new events found.")
             return
 
         print(f"[DEBUG] Found {len(events_manager.events)} events to process")
-        # Process all events
-        for i, event in enumerate(events_manager.events, 1):
-            print(f"\n\n=== EVENT {i} ===")
-            # Measure scrape time for create_fights
-            start_time = time.time()
-            try:
-                event.create_fights()
-            except KeyboardInterrupt:
-                print(f"\n[INFO] Keyboard interrupt received during event {i} ({event.name}). Saving scraped data...")
-                # Save to database
-                events_manager.to_sql(**db_config)
-                # Save to CSV
-                events_manager.to_csv("UFCStats.csv")
-                print("[INFO] Data saved successfully. Exiting.")
-                return  # Exit after saving
-            scrape_time = time.time() - start_time
-            # Pass scrape_time to to_string
-            print(event.to_string(scrape_time=scrape_time))
+        # Process events in batches; each batch fetches all of its fight and fighter pages together,
+        # sharing the fighter and page caches
+        completed = 0
+        try:
+            for batch_start in range(0, len(events_manager.events), EVENT_BATCH_SIZE):
+                batch = events_manager.events[batch_start:batch_start + EVENT_BATCH_SIZE]
+                start_time = time.time()
+                events_manager.create_fights_bulk(batch)
+                scrape_time = time.time() - start_time
+                # Event summaries are only built when asked for; the time shown is the whole batch's
+                if args.verbose:
+                    for i, event in enumerate(batch, batch_start + 1):
+                        print(f"\n\n=== EVENT {i} ===")
+                        print(event.to_string(scrape_time=scrape_time))
+                completed += len(batch)
+                print(f"Scraped {completed}/{len(events_manager.events)} events ({scrape_time:.1f} s for the last batch)")
+        except KeyboardInterrupt:
+            # Keep only the events of fully scraped batches
+            events_manager.events = events_manager.events[:completed]
+            raise
 
         # Insert all events into MySQL
         events_manager.to_sql(**db_config)
@@ -1668,6 +2703,9 @@ def main():
     finally:
         if 'conn' in locals():
             conn.close()
+        # Drop page fetches still queued on the shared pool (e.g. after Ctrl-C); without this the
+        # interpreter would run every queued fetch before exiting
+        FETCH_EXECUTOR.shutdown(wait=False, cancel_futures=True)
 
 if __name__ == "__main__":
     main()